@@ -1,7 +1,9 @@
 """Configuration settings for pipeline hardening."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
+from pydantic import Field
 from pydantic_settings import BaseSettings
 
 
@@ -11,13 +13,21 @@ class Settings(BaseSettings):
     # Database
     database_url: str = "sqlite+aiosqlite:///./pipeline.db"
 
-    # GitHub
-    github_token: str = os.getenv("GITHUB_TOKEN", "")
-    github_repo_owner: str = os.getenv("GITHUB_REPO_OWNER", "PROACTIVA-US")
-    github_repo_name: str = os.getenv("GITHUB_REPO_NAME", "PipelineHardening")
+    # GitHub (env reads deferred to instantiation via default factories)
+    github_token: str = Field(default_factory=lambda: os.getenv("GITHUB_TOKEN", ""))
+    github_repo_owner: str = Field(
+        default_factory=lambda: os.getenv("GITHUB_REPO_OWNER", "PROACTIVA-US")
+    )
+    github_repo_name: str = Field(
+        default_factory=lambda: os.getenv("GITHUB_REPO_NAME", "PipelineHardening")
+    )
 
     # Execution
     repo_path: str = str(Path(__file__).parent.parent.parent)  # Project root (backend -> app -> config.py)
+    # Artificial per-test latency (seconds) for mock/dev runs. Defaults to
+    # 0 so profiling measures real queue/pool overhead; override with the
+    # SIMULATE_TEST_LATENCY env var when simulating slow tasks.
+    simulate_test_latency: float = 0.0
 
     # Server
     host: str = "0.0.0.0"
@@ -27,4 +37,20 @@ class Settings(BaseSettings):
         env_file = ".env"
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the cached Settings instance.
+
+    Settings construction parses .env and the environment; caching it
+    means every import path and test worker shares one instance instead
+    of re-running Pydantic model construction.
+    """
+    return Settings()
+
+
+def __getattr__(name: str):
+    # Lazy module attribute so `from app.config import settings` keeps
+    # working without constructing Settings at import time.
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,11 +3,16 @@
 from contextlib import contextmanager
 from typing import Generator
 
-from sqlalchemy import create_engine
+import orjson
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
-from app.config import settings
+from app.config import get_settings
+
+settings = get_settings()
 
 
 class Base(DeclarativeBase):
@@ -15,11 +20,86 @@ class Base(DeclarativeBase):
     pass
 
 
-# Async engine for API endpoints
+def _json_serializer(value) -> str:
+    """orjson-backed serializer for JSON columns (extra_data, commits).
+
+    orjson is several times faster than stdlib json on the small dicts
+    written on every status update; SQLite wants text, so decode the
+    bytes it produces.
+    """
+    return orjson.dumps(value).decode()
+
+
+@event.listens_for(Engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune SQLite for concurrent worker/batch workloads.
+
+    WAL lets readers proceed while a writer commits, NORMAL synchronous
+    skips the full fsync per commit (safe with WAL), and the remaining
+    pragmas keep temp tables and hot pages in memory. Registered on the
+    Engine class so it fires for every new sqlite3/aiosqlite connection
+    from both the async and sync pools.
+    """
+    # Disable the driver's implicit transaction handling so the begin
+    # hooks below control transaction start (BEGIN IMMEDIATE vs DEFERRED).
+    dbapi_connection.isolation_level = None
+
+    cursor = dbapi_connection.cursor()
+    for pragma in (
+        # page_size must run before the first table is created; mmap lets
+        # reads come out of the OS page cache instead of pread() syscalls.
+        "PRAGMA page_size=8192",
+        "PRAGMA mmap_size=268435456",
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-64000",
+        "PRAGMA busy_timeout=5000",
+        "PRAGMA foreign_keys=ON",
+    ):
+        cursor.execute(pragma)
+    cursor.close()
+
+
+# Async engines for API endpoints
+# Persistent pool: reusing connections avoids per-checkout file open and
+# WAL-shm setup, which dominates cost on the worker's hot DB calls.
+#
+# SQLite allows exactly one writer at a time, so the write engine keeps a
+# single pooled connection (writes are serialized at checkout instead of
+# colliding on SQLITE_BUSY), while reads fan out over their own pool and
+# proceed in parallel with the writer under WAL.
+# pool_pre_ping is off: there is no network link to a local file DB, so
+# the per-checkout validation query is pure overhead. pool_recycle still
+# resets aged connections and SQLAlchemy invalidates on the first error.
 engine = create_async_engine(
     settings.database_url,
     echo=False,
-    pool_pre_ping=True,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=1,
+    max_overflow=0,
+    pool_recycle=3600,
+    connect_args={"check_same_thread": False},
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+)
+
+# Read-only engine: mode=ro via a file: URI so SQLite rejects accidental
+# writes and the connections never take the write lock.
+read_database_url = (
+    settings.database_url.replace("sqlite+aiosqlite:///", "sqlite+aiosqlite:///file:")
+    + "?mode=ro&uri=true"
+)
+read_engine = create_async_engine(
+    read_database_url,
+    echo=False,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=8,
+    max_overflow=4,
+    pool_recycle=3600,
+    connect_args={"check_same_thread": False},
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
 )
 
 async_session = async_sessionmaker(
@@ -28,12 +108,24 @@ async_session = async_sessionmaker(
     expire_on_commit=False,
 )
 
+async_read_session = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
 # Sync engine for background tasks (avoids greenlet issues)
 sync_database_url = settings.database_url.replace("sqlite+aiosqlite:", "sqlite:")
 sync_engine = create_engine(
     sync_database_url,
     echo=False,
-    pool_pre_ping=True,
+    poolclass=QueuePool,
+    pool_size=5,
+    max_overflow=10,
+    pool_recycle=3600,
+    connect_args={"check_same_thread": False},
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
 )
 
 sync_session = sessionmaker(
@@ -42,6 +134,22 @@ sync_session = sessionmaker(
 )
 
 
+# Write transactions take the reserved lock up front with BEGIN IMMEDIATE.
+# A DEFERRED transaction that upgrades to a write mid-flight raises
+# SQLITE_BUSY when another writer holds the lock; grabbing it at BEGIN
+# time lets busy_timeout queue writers cleanly instead. The read-only
+# engine keeps DEFERRED snapshots.
+@event.listens_for(engine.sync_engine, "begin")
+@event.listens_for(sync_engine, "begin")
+def _begin_immediate(conn):
+    conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+@event.listens_for(read_engine.sync_engine, "begin")
+def _begin_deferred(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
 @contextmanager
 def get_sync_db() -> Generator[Session, None, None]:
     """Context manager for sync database sessions."""
@@ -57,13 +165,29 @@ def get_sync_db() -> Generator[Session, None, None]:
 
 
 async def init_db() -> None:
-    """Initialize database tables."""
+    """Initialize database tables.
+
+    create_all issues a sqlite_master lookup plus CREATE TABLE IF NOT
+    EXISTS per model even when the schema already exists, so probe for a
+    sentinel table first and skip the whole round trip on warm starts.
+    """
+    from sqlalchemy import text
+
     async with engine.begin() as conn:
+        result = await conn.execute(
+            text(
+                "SELECT name FROM sqlite_master "
+                "WHERE type='table' AND name='autonomous_sessions'"
+            )
+        )
+        if result.first() is not None:
+            return
+
         await conn.run_sync(Base.metadata.create_all)
 
 
 async def get_db() -> AsyncSession:
-    """Dependency for getting database session."""
+    """Dependency for getting a read-write database session."""
     async with async_session() as session:
         try:
             yield session
@@ -73,3 +197,16 @@ async def get_db() -> AsyncSession:
             raise
         finally:
             await session.close()
+
+
+async def get_read_db() -> AsyncSession:
+    """Dependency for getting a read-only database session.
+
+    Backed by the mode=ro pool, so status/lookup endpoints never contend
+    with the single writer connection.
+    """
+    async with async_read_session() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
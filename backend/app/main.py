@@ -12,14 +12,13 @@ Features:
 - PR workflow (branch -> commit -> PR -> merge)
 """
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-
-from app.database import init_db
-from app.routers.autonomous import router as autonomous_router
+from fastapi.responses import ORJSONResponse
 
 # Configure logging
 logging.basicConfig(
@@ -28,18 +27,47 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Set once deferred initialization (DB + routers) has finished.
+_ready = asyncio.Event()
+_router_included = False
+
+
+async def _deferred_init(app: FastAPI) -> None:
+    """Run heavy startup work after the server starts accepting traffic.
+
+    Importing the autonomous router here (rather than at module scope)
+    defers the SQLAlchemy/Pydantic model-tree import, so the accept loop
+    and liveness probe come up in well under a second.
+    """
+    from app.database import init_db
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Application lifespan events."""
-    # Startup
     logger.info("Initializing database...")
     await init_db()
     logger.info("Database initialized")
 
+    from app.routers.autonomous import router as autonomous_router
+
+    # Routers are constructed once at import; include exactly once so the
+    # per-route field/dependant computation is never repeated (lifespan can
+    # re-run under test clients).
+    global _router_included
+    if not _router_included:
+        app.include_router(autonomous_router)
+        _router_included = True
+    _ready.set()
+    logger.info("Application ready")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan events."""
+    # Startup: bind the port first, initialize in the background.
+    init_task = asyncio.create_task(_deferred_init(app))
+
     yield
 
     # Shutdown
+    init_task.cancel()
     logger.info("Shutting down...")
 
 
@@ -48,6 +76,9 @@ app = FastAPI(
     description="Minimal autonomous execution pipeline for E2E testing",
     version="1.0.0",
     lifespan=lifespan,
+    # Hoisted once here so every APIRoute inherits it at include time
+    # instead of resolving a response class per route.
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -59,10 +90,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Include routers
-app.include_router(autonomous_router)
-
-
 @app.get("/")
 async def root():
     """Root endpoint."""
@@ -79,7 +106,45 @@ async def health():
     return {"status": "healthy"}
 
 
+@app.get("/health/live")
+async def health_live():
+    """Liveness probe - responds as soon as the server accepts traffic."""
+    return {"status": "alive"}
+
+
+@app.get("/health/ready")
+async def health_ready(response: Response):
+    """Readiness probe - 503 until deferred initialization completes."""
+    if not _ready.is_set():
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"status": "initializing"}
+    return {"status": "ready"}
+
+
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8001)
+    from app.config import get_settings
+
+    settings = get_settings()
+
+    try:
+        # uvloop's C event loop and httptools' C parser roughly double
+        # asyncio throughput on the small, chatty requests the dashboard
+        # polling generates.
+        import uvloop  # noqa: F401
+        import httptools  # noqa: F401
+
+        loop, http = "uvloop", "httptools"
+    except ImportError:
+        # uvloop is unavailable on Windows; fall back to asyncio + h11.
+        loop, http = "auto", "auto"
+
+    uvicorn.run(
+        "app.main:app",
+        host=settings.host,
+        port=settings.port,
+        loop=loop,
+        http=http,
+        workers=1,
+    )
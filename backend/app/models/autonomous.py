@@ -1,14 +1,25 @@
 """Data models for autonomous batch execution system."""
 
 import enum
-from sqlalchemy import Column, String, Integer, DateTime, Text, Boolean, JSON, ForeignKey
+from sqlalchemy import Column, String, Integer, DateTime, Text, Boolean, JSON, ForeignKey, Index
+from sqlalchemy import Enum as SAEnum
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
 from app.database import Base
 
 
-class BatchStatus(enum.Enum):
+def _enum_values(enum_cls):
+    """Store enum values (not names) in the database."""
+    return [member.value for member in enum_cls]
+
+
+# The status enums mix in str so values loaded through the SAEnum columns
+# still compare equal to the plain "pending"/"complete" strings used by the
+# runner, orchestrator and response schemas.
+
+
+class BatchStatus(str, enum.Enum):
     """Status of a batch execution."""
     PENDING = "pending"
     READY = "ready"
@@ -17,7 +28,7 @@ class BatchStatus(enum.Enum):
     FAILED = "failed"
 
 
-class TaskStatus(enum.Enum):
+class TaskStatus(str, enum.Enum):
     """Status of a task execution."""
     PENDING = "pending"
     IN_PROGRESS = "in_progress"
@@ -26,7 +37,7 @@ class TaskStatus(enum.Enum):
     FAILED = "failed"
 
 
-class SessionStatus(enum.Enum):
+class SessionStatus(str, enum.Enum):
     """Status of an autonomous execution session."""
     STARTED = "started"
     PAUSED = "paused"
@@ -44,49 +55,76 @@ class AutonomousSession(Base):
     start_batch = Column(Integer, nullable=False)
     end_batch = Column(Integer, nullable=False)
     execution_mode = Column(String, nullable=False)  # local
-    status = Column(String, nullable=False, index=True)
+    status = Column(
+        SAEnum(SessionStatus, values_callable=_enum_values, native_enum=False,
+               length=16, create_constraint=True),
+        nullable=False, index=True,
+    )
     current_batch = Column(Integer)
     tasks_completed = Column(Integer, default=0)
     tasks_total = Column(Integer, default=0)
     auto_merge = Column(Boolean, default=True)
     started_at = Column(DateTime(timezone=True), server_default=func.now())
     completed_at = Column(DateTime(timezone=True))
-    extra_data = Column(JSON, default={})
+    extra_data = Column(JSON, default=dict)
 
 
 class BatchExecution(Base):
     """Represents execution of a single batch from a plan."""
     __tablename__ = "batch_executions"
 
+    # Composite index matches the runner's ready-batch dispatch query
+    # (WHERE session_id = ? AND status IN (...)); its prefix also covers
+    # plain session_id lookups, so no single-column indexes are needed.
+    __table_args__ = (
+        Index("ix_batch_session_status", "session_id", "status"),
+    )
+
     id = Column(String, primary_key=True)
-    session_id = Column(String, nullable=False, index=True)
+    session_id = Column(String, nullable=False)
     plan_path = Column(String, nullable=False)
     batch_number = Column(Integer, nullable=False, index=True)
-    status = Column(String, nullable=False, index=True)
+    status = Column(
+        SAEnum(BatchStatus, values_callable=_enum_values, native_enum=False,
+               length=16, create_constraint=True),
+        nullable=False,
+    )
     started_at = Column(DateTime(timezone=True))
     completed_at = Column(DateTime(timezone=True))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    extra_data = Column(JSON, default={})
+    extra_data = Column(JSON, default=dict)
 
-    tasks = relationship("TaskExecution", back_populates="batch", cascade="all, delete-orphan")
+    # selectin batches the child load into one IN (...) query instead of a
+    # lazy per-batch query when batches are serialized with their tasks
+    tasks = relationship("TaskExecution", back_populates="batch", cascade="all, delete-orphan", lazy="selectin")
 
 
 class TaskExecution(Base):
     """Represents execution of a single task within a batch."""
     __tablename__ = "task_executions"
 
+    # Composite index matches the pending-task query in the runner
+    # (WHERE batch_execution_id = ? AND status = ?).
+    __table_args__ = (
+        Index("ix_task_batch_status", "batch_execution_id", "status"),
+    )
+
     id = Column(String, primary_key=True)
-    batch_execution_id = Column(String, ForeignKey("batch_executions.id", ondelete="CASCADE"), nullable=False, index=True)
+    batch_execution_id = Column(String, ForeignKey("batch_executions.id", ondelete="CASCADE"), nullable=False)
     task_number = Column(String, nullable=False, index=True)
     task_title = Column(String, nullable=False)
     branch_name = Column(String)
     pr_number = Column(Integer, index=True)
     pr_url = Column(String)
-    status = Column(String, nullable=False, index=True)
-    commits = Column(JSON, default=[])
+    status = Column(
+        SAEnum(TaskStatus, values_callable=_enum_values, native_enum=False,
+               length=16, create_constraint=True),
+        nullable=False,
+    )
+    commits = Column(JSON, default=list)
     started_at = Column(DateTime(timezone=True))
     completed_at = Column(DateTime(timezone=True))
     error = Column(Text)
-    extra_data = Column(JSON, default={})
+    extra_data = Column(JSON, default=dict)
 
     batch = relationship("BatchExecution", back_populates="tasks")
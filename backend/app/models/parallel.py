@@ -50,7 +50,7 @@ class ParallelTestSession(Base):
     max_retries = Column(Integer, default=2)
 
     # Relationships
-    test_executions = relationship("ParallelTestExecution", back_populates="session", cascade="all, delete-orphan")
+    test_executions = relationship("ParallelTestExecution", back_populates="session", cascade="all, delete-orphan", lazy="selectin")
 
 
 class ParallelTestExecution(Base):
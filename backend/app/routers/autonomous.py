@@ -7,7 +7,7 @@ from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.schemas.autonomous import (
     StartAutonomousRequest,
     StartAutonomousResponse,
@@ -73,7 +73,7 @@ async def start_autonomous_execution(
 @router.get("/{execution_id}/status", response_model=AutonomousStatusResponse)
 async def get_execution_status(
     execution_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get current status of an autonomous execution session."""
     try:
@@ -101,7 +101,7 @@ async def get_execution_status(
 @router.get("/{execution_id}/batches", response_model=List[BatchExecutionResponse])
 async def get_batches(
     execution_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get all batches for an execution session."""
     try:
@@ -148,7 +148,7 @@ async def get_batches(
 async def get_task(
     execution_id: str,
     task_number: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get details of a specific task."""
     try:
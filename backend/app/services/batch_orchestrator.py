@@ -7,10 +7,11 @@ Responsibilities:
 3. Track progress
 """
 
+import time
 import uuid
 import logging
 from datetime import datetime, timezone
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -26,6 +27,25 @@ from app.services.plan_parser import PlanParser, Batch, Task
 
 logger = logging.getLogger(__name__)
 
+# Short-TTL cache for get_session_status keyed by session id. Status polling
+# hits this endpoint far more often than the session actually changes, and a
+# 2s window is well under the poll interval, so most polls skip the two
+# SELECTs entirely. Module-level because orchestrators are constructed
+# per-request; writer methods invalidate their session's entry on commit.
+_STATUS_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_STATUS_CACHE_TTL = 2.0
+_STATUS_CACHE_MAX = 1024
+
+
+def _invalidate_status_cache(record_id: str) -> None:
+    """Drop the cached status for the session owning record_id.
+
+    Batch and task ids are prefixed with their session id
+    ({session_id}_batch_{n}[_task_{n}]), so the owner is recoverable
+    from any record id.
+    """
+    _STATUS_CACHE.pop(record_id.split("_batch_")[0], None)
+
 
 class OrchestratorError(Exception):
     """Base exception for orchestrator errors."""
@@ -165,6 +185,10 @@ class BatchOrchestrator:
 
     async def get_session_status(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Get current status of an execution session."""
+        cached = _STATUS_CACHE.get(session_id)
+        if cached is not None and time.monotonic() - cached[0] < _STATUS_CACHE_TTL:
+            return cached[1]
+
         try:
             result = await self.db.execute(
                 select(AutonomousSession).where(AutonomousSession.id == session_id)
@@ -184,7 +208,7 @@ class BatchOrchestrator:
             )
             active_prs = pr_result.scalars().all()
 
-            return {
+            status = {
                 "execution_id": session.id,
                 "status": session.status,
                 "current_batch": session.current_batch,
@@ -204,6 +228,11 @@ class BatchOrchestrator:
                 "completed_at": session.completed_at,
             }
 
+            if len(_STATUS_CACHE) >= _STATUS_CACHE_MAX:
+                _STATUS_CACHE.clear()
+            _STATUS_CACHE[session_id] = (time.monotonic(), status)
+            return status
+
         except Exception as e:
             logger.error(f"Failed to get session status: {e}")
             return None
@@ -251,6 +280,7 @@ class BatchOrchestrator:
             batch.status = BatchStatus.EXECUTING.value
             batch.started_at = datetime.now(timezone.utc)
             await self.db.commit()
+            _invalidate_status_cache(batch_id)
 
             logger.info(f"Batch {batch.batch_number} marked as executing")
             return True
@@ -274,6 +304,7 @@ class BatchOrchestrator:
             batch.status = BatchStatus.COMPLETE.value
             batch.completed_at = datetime.now(timezone.utc)
             await self.db.commit()
+            _invalidate_status_cache(batch_id)
 
             logger.info(f"Batch {batch.batch_number} marked as complete")
             return True
@@ -305,6 +336,7 @@ class BatchOrchestrator:
             task.pr_url = pr_url
             task.completed_at = datetime.now(timezone.utc)
             await self.db.commit()
+            _invalidate_status_cache(task_id)
 
             return True
 
@@ -328,6 +360,7 @@ class BatchOrchestrator:
             task.error = error
             task.completed_at = datetime.now(timezone.utc)
             await self.db.commit()
+            _invalidate_status_cache(task_id)
 
             return True
 
@@ -350,6 +383,7 @@ class BatchOrchestrator:
             session.status = SessionStatus.COMPLETE.value
             session.completed_at = datetime.now(timezone.utc)
             await self.db.commit()
+            _invalidate_status_cache(session_id)
 
             logger.info(f"Session {session_id} marked as complete")
             return True
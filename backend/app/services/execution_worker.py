@@ -3,9 +3,10 @@
 import asyncio
 import logging
 import os
+import time
 from pathlib import Path
 from typing import Optional
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 from .test_queue import TestQueue, TestRequest, TestResult, TestStatus
 from .worktree_pool import WorktreePool, WorktreeInfo, WorktreeAcquisitionTimeout
@@ -30,32 +31,42 @@ class ExecutionWorker:
 
     def __init__(
         self,
-        worker_id: str,
+        worker_id: "int | str",
         queue: TestQueue,
         pool: WorktreePool,
         task_timeout_seconds: float = 1800.0,  # 30 minutes default
         worktree_acquire_timeout: float = 300.0,  # 5 minutes default
+        batch_size: int = 4,
     ):
         """
         Initialize execution worker.
 
         Args:
-            worker_id: Unique identifier for this worker (e.g., "worker-1")
+            worker_id: Unique identifier for this worker. Plain ints are
+                preferred on hot paths (no f-string per worker); IDs are
+                only formatted when actually logged or repr'd.
             queue: Test queue to pull tests from
             pool: Worktree pool to acquire worktrees from
             task_timeout_seconds: Maximum time for a single task execution (default: 30 min)
             worktree_acquire_timeout: Maximum time to wait for a worktree (default: 5 min)
+            batch_size: Maximum tests pulled from the queue per wakeup
         """
         self.worker_id = worker_id
         self.queue = queue
         self.pool = pool
         self.task_timeout_seconds = task_timeout_seconds
         self.worktree_acquire_timeout = worktree_acquire_timeout
+        self.batch_size = batch_size
         self.running = False
+        self._state = "idle"  # idle -> running -> stopped
         self._task: Optional[asyncio.Task] = None
+        self._stop_event = asyncio.Event()
         self._current_test: Optional[str] = None
         self._current_test_started: Optional[datetime] = None
 
+    def __repr__(self) -> str:
+        return f"ExecutionWorker(worker_id={self.worker_id!r}, state={self._state})"
+
     async def start(self) -> None:
         """Start the worker loop in a background task."""
         if self.running:
@@ -63,6 +74,8 @@ class ExecutionWorker:
             return
 
         self.running = True
+        self._state = "running"
+        self._stop_event.clear()
         self._task = asyncio.create_task(self.run())
         logger.info(f"Worker {self.worker_id} started")
 
@@ -74,6 +87,7 @@ class ExecutionWorker:
 
         logger.info(f"Stopping worker {self.worker_id}...")
         self.running = False
+        self._stop_event.set()
 
         # Cancel the worker task
         if self._task and not self._task.done():
@@ -95,7 +109,7 @@ class ExecutionWorker:
 
         try:
             while self.running:
-                await self._process_next_test()
+                await self._process_next_batch()
 
         except asyncio.CancelledError:
             logger.info(f"Worker {self.worker_id} cancelled")
@@ -106,21 +120,53 @@ class ExecutionWorker:
             raise
 
         finally:
+            self._state = "stopped"
             logger.info(f"Worker {self.worker_id} exiting main loop")
 
-    async def _process_next_test(self) -> None:
-        """Process a single test from the queue."""
+    async def _process_next_batch(self) -> None:
+        """Pull a batch of tests from the queue and process them in order."""
+        # 1. Wait for the next batch or a stop signal, whichever comes
+        # first. An event-driven wait avoids the 1s timeout churn per idle
+        # worker and lets stop() take effect immediately instead of next
+        # tick. Pulling up to batch_size tests per wakeup amortizes the
+        # dequeue scheduling round trip when the queue is deep.
+        dequeue_task = asyncio.create_task(self.queue.dequeue_batch(self.batch_size))
+        stop_task = asyncio.create_task(self._stop_event.wait())
+
         try:
-            # 1. Get next test from queue (with timeout to allow checking self.running)
-            test_request = await asyncio.wait_for(
-                self.queue.dequeue(),
-                timeout=1.0
+            done, pending = await asyncio.wait(
+                {dequeue_task, stop_task},
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        except asyncio.CancelledError:
+            # asyncio.wait does not cancel its children when the outer
+            # task is cancelled, and stop() cancels this task directly —
+            # without cleanup the dequeue task would outlive the worker,
+            # still subscribed to the queue, and steal the next enqueued
+            # request on a later start.
+            dequeue_task.cancel()
+            stop_task.cancel()
+            batch, _ = await asyncio.gather(
+                dequeue_task, stop_task, return_exceptions=True
             )
+            if isinstance(batch, list):
+                # The dequeue completed before the cancellation landed;
+                # hand the batch back so no request is stranded in flight.
+                await self.queue.return_batch(batch)
+            raise
+
+        for task in pending:
+            task.cancel()
 
-        except asyncio.TimeoutError:
-            # No test available, loop again to check if we should stop
+        if dequeue_task not in done:
+            # Stop requested while idle
             return
 
+        for test_request in dequeue_task.result():
+            await self._process_test(test_request)
+
+    async def _process_test(self, test_request: TestRequest) -> None:
+        """Process a single dequeued test."""
         logger.info(
             f"Worker {self.worker_id} got test: {test_request.plan_file} "
             f"(id: {test_request.id})"
@@ -142,6 +188,9 @@ class ExecutionWorker:
                     test_name=test_request.plan_file,
                     timeout=self.worktree_acquire_timeout,
                 )
+                # Read-only tests leave the tree pristine, so the pool can
+                # skip cleanup before its next handout
+                worktree.mutating = not test_request.config.read_only
                 logger.info(
                     f"Worker {self.worker_id} acquired worktree {worktree.id} "
                     f"for test {test_request.id}"
@@ -160,21 +209,18 @@ class ExecutionWorker:
                     f"Task execution exceeded timeout of {self.task_timeout_seconds}s"
                 )
 
-            # 5. Handle result - complete or retry
-            if result.status == "COMPLETE":
-                await self.queue.mark_complete(test_request.id, result)
+            # 5. Handle result - complete or retry (single locked transition)
+            if result.status is TestStatus.COMPLETE:
+                await self.queue.transition(test_request, TestStatus.COMPLETE, result)
                 logger.info(
                     f"Worker {self.worker_id} completed test {test_request.id}: "
                     f"{result.tasks_passed} passed, {result.tasks_failed} failed"
                 )
 
-            elif result.status == "FAILED":
-                # Try to retry if retries remain
-                should_retry = await self.queue.requeue_for_retry(test_request)
+            elif result.status is TestStatus.FAILED:
+                retried = await self.queue.transition(test_request, TestStatus.FAILED, result)
 
-                if not should_retry:
-                    # Max retries exceeded, mark as failed
-                    await self.queue.mark_failed(test_request.id, result)
+                if not retried:
                     logger.error(
                         f"Worker {self.worker_id} failed test {test_request.id} "
                         f"after {test_request.retry_count} retries: {result.error}"
@@ -187,14 +233,14 @@ class ExecutionWorker:
             result = TestResult(
                 test_request_id=test_request.id,
                 worktree_id=worktree.id if worktree else "unknown",
-                status="FAILED",
+                status=TestStatus.FAILED,
                 error=f"Timeout: {str(e)}",
                 started_at=self._current_test_started,
                 completed_at=datetime.now(timezone.utc),
             )
 
             # Don't retry timeouts - they'll likely timeout again
-            await self.queue.mark_failed(test_request.id, result)
+            await self.queue.transition(test_request, TestStatus.FAILED, result, allow_retry=False)
 
         except Exception as e:
             # Worker-level error (not test execution error)
@@ -204,14 +250,12 @@ class ExecutionWorker:
             result = TestResult(
                 test_request_id=test_request.id,
                 worktree_id=worktree.id if worktree else "unknown",
-                status="FAILED",
+                status=TestStatus.FAILED,
                 error=f"Worker error: {str(e)}",
             )
 
             # Try to retry or mark as failed
-            should_retry = await self.queue.requeue_for_retry(test_request)
-            if not should_retry:
-                await self.queue.mark_failed(test_request.id, result)
+            await self.queue.transition(test_request, TestStatus.FAILED, result)
 
         finally:
             # Clear current test tracking
@@ -246,7 +290,9 @@ class ExecutionWorker:
         Returns:
             TestResult with execution details
         """
+        # Monotonic clock for the duration; datetimes only at the edges
         started_at = datetime.now(timezone.utc)
+        t0 = time.monotonic()
         logger.info(
             f"Worker {self.worker_id} executing test {test_request.id} "
             f"in worktree {worktree.id}"
@@ -268,8 +314,8 @@ class ExecutionWorker:
 
         except Exception as e:
             # Test execution failed
-            completed_at = datetime.now(timezone.utc)
-            duration = (completed_at - started_at).total_seconds()
+            duration = time.monotonic() - t0
+            completed_at = started_at + timedelta(seconds=duration)
 
             logger.error(
                 f"Worker {self.worker_id} test {test_request.id} failed: {e}"
@@ -278,7 +324,7 @@ class ExecutionWorker:
             return TestResult(
                 test_request_id=test_request.id,
                 worktree_id=worktree.id,
-                status="FAILED",
+                status=TestStatus.FAILED,
                 error=str(e),
                 started_at=started_at,
                 completed_at=completed_at,
@@ -302,6 +348,7 @@ class ExecutionWorker:
         Returns:
             TestResult with execution details
         """
+        t0 = time.monotonic()
         tasks_passed = 0
         tasks_failed = 0
         error_msg = None
@@ -373,10 +420,10 @@ class ExecutionWorker:
             error_msg = f"Execution error: {e}"
             logger.error(f"Worker {self.worker_id} {error_msg}")
 
-        completed_at = datetime.now(timezone.utc)
-        duration = (completed_at - started_at).total_seconds()
+        duration = time.monotonic() - t0
+        completed_at = started_at + timedelta(seconds=duration)
 
-        status = "COMPLETE" if tasks_failed == 0 and not error_msg else "FAILED"
+        status = TestStatus.COMPLETE if tasks_failed == 0 and not error_msg else TestStatus.FAILED
 
         return TestResult(
             test_request_id=test_request.id,
@@ -397,10 +444,13 @@ class ExecutionWorker:
         Returns:
             Dictionary with worker status information
         """
+        # State is maintained at start/stop/run boundaries so status reads
+        # are plain attribute lookups, not asyncio task introspection.
         status = {
             "worker_id": self.worker_id,
             "running": self.running,
-            "task_done": self._task.done() if self._task else True,
+            "state": self._state,
+            "task_done": self._state != "running",
             "current_test": self._current_test,
             "task_timeout_seconds": self.task_timeout_seconds,
         }
@@ -3,7 +3,7 @@
 import asyncio
 import logging
 import uuid
-from typing import List, Optional, Dict
+from typing import AsyncIterator, List, Optional, Dict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
@@ -29,6 +29,7 @@ class ParallelTestConfig:
     # Worker settings
     worker_task_timeout_seconds: float = 1800.0  # 30 minutes per task
     worktree_acquire_timeout_seconds: float = 300.0  # 5 minutes to acquire worktree
+    worker_batch_size: int = 4  # Tests a worker pulls from the queue per wakeup
 
     # Cleanup settings
     cleanup_on_completion: bool = True
@@ -122,14 +123,16 @@ class ParallelTestOrchestrator:
         # Initialize worktree pool
         await self.pool.initialize()
 
-        # Create workers with configured timeouts
+        # Create workers with configured timeouts (plain int IDs; they
+        # are only formatted when logged)
         for i in range(1, self.config.num_workers + 1):
             worker = ExecutionWorker(
-                worker_id=f"worker-{i}",
+                worker_id=i,
                 queue=self.queue,
                 pool=self.pool,
                 task_timeout_seconds=self.config.worker_task_timeout_seconds,
                 worktree_acquire_timeout=self.config.worktree_acquire_timeout_seconds,
+                batch_size=self.config.worker_batch_size,
             )
             self.workers.append(worker)
 
@@ -150,11 +153,20 @@ class ParallelTestOrchestrator:
             return
 
         logger.info("Starting all workers...")
+
+        # Eager tasks (3.12+) run each spawned coroutine synchronously up
+        # to its first suspension, so worker loops and the short-lived
+        # queue coroutines skip a scheduler round trip per task.
+        if hasattr(asyncio, "eager_task_factory"):
+            asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
         self.started_at = datetime.now(timezone.utc)
 
-        # Start all workers
-        for worker in self.workers:
-            await worker.start()
+        # Start all workers concurrently: one suspension for the whole
+        # fan-out instead of one serial await per worker.
+        async with asyncio.TaskGroup() as tg:
+            for worker in self.workers:
+                tg.create_task(worker.start())
 
         self._running = True
         logger.info(f"All {len(self.workers)} workers started")
@@ -169,15 +181,48 @@ class ParallelTestOrchestrator:
         await self.queue.enqueue(test_request)
         logger.info(f"Submitted test: {test_request.plan_file} (id: {test_request.id})")
 
-    async def submit_batch(self, test_requests: List[TestRequest]) -> None:
+    async def submit_batch(
+        self, test_requests: List[TestRequest]
+    ) -> List["asyncio.Future[TestResult]"]:
         """
         Submit multiple tests at once.
 
         Args:
             test_requests: List of test requests to execute
+
+        Returns:
+            One completion future per request, in submission order.
+            Callers that only want the aggregate report can ignore them
+            and await wait_for_completion(); consuming them (e.g. via
+            asyncio.as_completed) reacts to each result as it lands.
         """
         await self.queue.enqueue_batch(test_requests)
         logger.info(f"Submitted batch of {len(test_requests)} tests")
+        return [self.queue.result_future(request.id) for request in test_requests]
+
+    async def stream_results(
+        self,
+        futures: Optional[List["asyncio.Future[TestResult]"]] = None,
+    ) -> AsyncIterator[TestResult]:
+        """
+        Yield test results as each test reaches a terminal state.
+
+        Callers see the first result after one test finishes instead of
+        after the whole run, and hold a single TestResult at a time
+        rather than the fully buffered report.
+
+        Args:
+            futures: Completion futures to stream (e.g. the return value
+                of submit_batch). Defaults to every tracked request.
+
+        Yields:
+            TestResult objects in completion order
+        """
+        if futures is None:
+            futures = self.queue.all_result_futures()
+
+        for next_done in asyncio.as_completed(futures):
+            yield await next_done
 
     async def run_tests(
         self,
@@ -216,7 +261,15 @@ class ParallelTestOrchestrator:
         ]
 
         # Submit tests
-        await self.submit_batch(requests)
+        futures = await self.submit_batch(requests)
+
+        # Drain results as they land: first result is visible after one
+        # test instead of after the whole run. The report is still
+        # assembled from queue state afterwards.
+        async for result in self.stream_results(futures):
+            logger.info(
+                f"Test {result.test_request_id} finished: {result.status}"
+            )
 
         # Wait for completion
         report = await self.wait_for_completion()
@@ -253,12 +306,16 @@ class ParallelTestOrchestrator:
         """
         logger.info("Shutting down orchestrator...")
 
-        # Stop all workers
-        for worker in self.workers:
-            try:
-                await worker.stop()
-            except Exception as e:
-                logger.error(f"Error stopping worker {worker.worker_id}: {e}")
+        # Stop all workers concurrently. gather (not TaskGroup) so one
+        # failing stop doesn't cancel the others; errors are logged per
+        # worker as before.
+        results = await asyncio.gather(
+            *(worker.stop() for worker in self.workers),
+            return_exceptions=True,
+        )
+        for worker, outcome in zip(self.workers, results):
+            if isinstance(outcome, BaseException):
+                logger.error(f"Error stopping worker {worker.worker_id}: {outcome}")
 
         # Cleanup worktrees (unless preserving failed ones)
         if self.config.cleanup_on_completion:
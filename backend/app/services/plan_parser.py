@@ -50,6 +50,13 @@ class PlanParseError(Exception):
     pass
 
 
+# Parsed-plan memo keyed on (path, mtime_ns): parsing is a pure function
+# of the file contents, and callers routinely construct a fresh parser
+# per lookup. mtime_ns invalidates the entry when the plan is edited.
+# Entries are shared, so callers must not mutate the returned batches.
+_parse_cache: dict = {}
+
+
 class PlanParser:
     """Parses structured markdown implementation plans."""
 
@@ -63,6 +70,12 @@ class PlanParser:
 
     def parse(self) -> List[Batch]:
         """Parse the plan file and extract all batches and tasks."""
+        cache_key = (str(self.plan_path), self.plan_path.stat().st_mtime_ns)
+        cached = _parse_cache.get(cache_key)
+        if cached is not None:
+            self.batches = cached
+            return self.batches
+
         batch_pattern = r'#{2,3} Batch (\d+(?:\.\d+)?):\s*([^\n]+)'
         batch_matches = list(re.finditer(batch_pattern, self.content))
 
@@ -86,6 +99,7 @@ class PlanParser:
                 raise PlanParseError(f"Batch {batch_num} parsing failed: {e}") from e
 
         logger.info(f"Parsed {len(self.batches)} batches with {sum(len(b.tasks) for b in self.batches)} total tasks")
+        _parse_cache[cache_key] = self.batches
         return self.batches
 
     def _parse_batch(self, batch_num: int, title: str, content: str) -> Batch:
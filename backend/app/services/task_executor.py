@@ -11,20 +11,46 @@ Handles the complete lifecycle:
 """
 
 import asyncio
+import functools
 import subprocess
 import logging
 import os
 from datetime import datetime, timezone
 from pathlib import Path
+from string import Template
 from typing import Optional, List, Tuple
 from dataclasses import dataclass, field
 
 from github import Github, GithubException, Auth
 
-from app.config import settings
+from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Prompt skeleton compiled once at import: Template parses its
+# placeholders here, so each _build_prompt call is pure substitution
+# (values are never parsed, so $ in implementation text is safe) instead
+# of rebuilding the scaffold from a list of parts per task.
+_PROMPT_TEMPLATE = Template(
+    "# Task $task_number: $task_title\n"
+    "\n"
+    "## Files to modify\n"
+    "$files_block\n"
+    "\n"
+    "## Implementation\n"
+    "$implementation\n"
+    "\n"
+    "## Verification\n"
+    "After completing, run these commands to verify:\n"
+    "$verification_block\n"
+    "\n"
+    "## Instructions\n"
+    "1. Implement the changes described above\n"
+    "2. Ensure all tests pass\n"
+    "3. Follow existing code patterns\n"
+    "4. Do not modify unrelated files"
+)
+
 
 class TaskExecutorError(Exception):
     """Base exception for task executor errors."""
@@ -85,10 +111,10 @@ class TaskExecutor:
         repo_owner: Optional[str] = None,
         repo_name: Optional[str] = None,
     ):
-        self.repo_path = Path(repo_path) if repo_path else Path(settings.repo_path)
-        self.github_token = github_token or settings.github_token
-        self.repo_owner = repo_owner or settings.github_repo_owner or "PROACTIVA-US"
-        self.repo_name = repo_name or settings.github_repo_name or "PipelineHardening"
+        self.repo_path = Path(repo_path) if repo_path else Path(get_settings().repo_path)
+        self.github_token = github_token or get_settings().github_token
+        self.repo_owner = repo_owner or get_settings().github_repo_owner or "PROACTIVA-US"
+        self.repo_name = repo_name or get_settings().github_repo_name or "PipelineHardening"
         self._github: Optional[Github] = None
 
     @property
@@ -221,8 +247,15 @@ class TaskExecutor:
                 claude_output=claude_output,
             )
 
-    def _generate_branch_name(self, batch_number: int, task_number: str) -> str:
-        """Generate feature branch name."""
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _generate_branch_name(batch_number: int, task_number: str) -> str:
+        """Generate feature branch name.
+
+        Pure function of its arguments, so repeat calls for the same
+        task (retries re-derive the branch per attempt) hit the cache
+        instead of reformatting.
+        """
         sanitized_task = task_number.replace(".", "-")
         return f"feature/batch-{batch_number}-task-{sanitized_task}"
 
@@ -291,37 +324,13 @@ class TaskExecutor:
         verification_steps: List[str],
     ) -> str:
         """Build the execution prompt for Claude."""
-        prompt_parts = [
-            f"# Task {task_number}: {task_title}",
-            "",
-            "## Files to modify",
-        ]
-
-        for f in files:
-            prompt_parts.append(f"- {f}")
-
-        prompt_parts.extend([
-            "",
-            "## Implementation",
-            implementation,
-            "",
-            "## Verification",
-            "After completing, run these commands to verify:",
-        ])
-
-        for step in verification_steps:
-            prompt_parts.append(f"- {step}")
-
-        prompt_parts.extend([
-            "",
-            "## Instructions",
-            "1. Implement the changes described above",
-            "2. Ensure all tests pass",
-            "3. Follow existing code patterns",
-            "4. Do not modify unrelated files",
-        ])
-
-        return "\n".join(prompt_parts)
+        return _PROMPT_TEMPLATE.substitute(
+            task_number=task_number,
+            task_title=task_title,
+            files_block="\n".join(f"- {f}" for f in files),
+            implementation=implementation,
+            verification_block="\n".join(f"- {step}" for step in verification_steps),
+        )
 
     async def _execute_with_claude(
         self,
@@ -2,35 +2,55 @@
 
 import asyncio
 import logging
+from collections import deque
 from typing import Dict, Optional
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from enum import Enum
+from enum import IntEnum
 
 logger = logging.getLogger(__name__)
 
 
-class TestStatus(Enum):
-    """Status of a test execution."""
-    PENDING = "pending"
-    RUNNING = "running"
-    COMPLETE = "complete"
-    FAILED = "failed"
-    RETRY = "retry"
+class TestStatus(IntEnum):
+    """Status of a test execution.
+
+    IntEnum so the worker's status dispatch is an identity/integer
+    compare instead of short-string equality on the hot path. Serialize
+    with .name at JSON/log boundaries.
+    """
+    PENDING = 0
+    RUNNING = 1
+    COMPLETE = 2
+    FAILED = 3
+    RETRY = 4
+
+    def __str__(self) -> str:
+        return self.name
 
 
-@dataclass
+@dataclass(slots=True)
 class TestHarnessConfig:
     """Configuration for test harness execution."""
     task_timeout: int = 600  # seconds
     max_retries: int = 2
     auto_merge: bool = True
     github_token: Optional[str] = None
+    read_only: bool = False  # Test doesn't mutate its worktree (skips cleanup)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class TestRequest:
-    """Request to execute a test plan."""
+    """Request to execute a test plan.
+
+    Slotted: requests are allocated in batches on the submit hot path,
+    and slots skip the per-instance __dict__ (roughly a third of the
+    object's footprint here).
+
+    Identity is the request id: the dataclass default would compare and
+    hash every field (including the config object), so equality and
+    hashing are defined by id alone — consistent with the queue keying
+    its running/completed/failed state by id.
+    """
     id: str                                    # Unique test request ID
     plan_file: str                             # "docs/plans/e2e-test-01.md"
     batch_range: str = "all"                   # "all" or "1-3"
@@ -40,13 +60,23 @@ class TestRequest:
     max_retries: int = 2                       # Max retries allowed
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, TestRequest) and self.id == other.id
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
-    """Result of a test execution."""
+    """Result of a test execution.
+
+    Slotted like TestRequest: one result is allocated per finished test
+    and read repeatedly by summaries and reports.
+    """
     test_request_id: str
     worktree_id: str
-    status: str                                # COMPLETE, FAILED
+    status: TestStatus                         # COMPLETE, FAILED
     tasks_passed: int = 0
     tasks_failed: int = 0
     report_path: Optional[str] = None
@@ -55,6 +85,89 @@ class TestResult:
     completed_at: Optional[datetime] = None
     duration_seconds: Optional[float] = None
 
+    def __post_init__(self):
+        # Accept the legacy "COMPLETE"/"FAILED" strings used by existing
+        # call sites and normalize to TestStatus members.
+        if isinstance(self.status, str):
+            self.status = TestStatus[self.status.upper()]
+
+    @classmethod
+    def make_complete(
+        cls,
+        test_id: str,
+        worktree_id: str,
+        tasks_passed: int = 0,
+        tasks_failed: int = 0,
+    ) -> "TestResult":
+        """Build a COMPLETE result with the enum status pre-set."""
+        return cls(
+            test_request_id=test_id,
+            worktree_id=worktree_id,
+            status=TestStatus.COMPLETE,
+            tasks_passed=tasks_passed,
+            tasks_failed=tasks_failed,
+        )
+
+    @classmethod
+    def make_failed(
+        cls,
+        test_id: str,
+        worktree_id: str,
+        error: Optional[str] = None,
+    ) -> "TestResult":
+        """Build a FAILED result with the enum status pre-set."""
+        return cls(
+            test_request_id=test_id,
+            worktree_id=worktree_id,
+            status=TestStatus.FAILED,
+            error=error,
+        )
+
+
+class FastAsyncDeque:
+    """
+    Unbounded async queue: a deque plus one Event instead of asyncio.Queue.
+
+    asyncio.Queue allocates a waiter Future per blocked get and keeps
+    _getters/_putters bookkeeping even when uncontended. With no size
+    bound there is nothing to block puts on, so a plain deque covers the
+    same put/put_nowait/get/get_nowait surface with a single Event for
+    the empty case. Drop-in for TestQueue.pending when max_size == 0.
+    """
+
+    def __init__(self):
+        self._items: deque = deque()
+        self._not_empty = asyncio.Event()
+
+    def put_nowait(self, item) -> None:
+        self._items.append(item)
+        self._not_empty.set()
+
+    async def put(self, item) -> None:
+        # Unbounded: a put can never block
+        self.put_nowait(item)
+
+    async def get(self):
+        # Loop: the Event wakes every waiter, but only one gets the item
+        while not self._items:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        return self._items.popleft()
+
+    def get_nowait(self):
+        if not self._items:
+            raise asyncio.QueueEmpty
+        return self._items.popleft()
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
 
 class TestQueue:
     """
@@ -69,14 +182,40 @@ class TestQueue:
         Initialize test queue.
 
         Args:
-            max_size: Maximum number of tests that can be queued
+            max_size: Maximum number of tests that can be queued.
+                0 means unbounded, served by the lighter FastAsyncDeque.
         """
         self.max_size = max_size
-        self.pending: asyncio.Queue[TestRequest] = asyncio.Queue(maxsize=max_size)
+        if max_size == 0:
+            self.pending = FastAsyncDeque()
+        else:
+            self.pending: asyncio.Queue[TestRequest] = asyncio.Queue(maxsize=max_size)
         self.running: Dict[str, TestRequest] = {}
         self.completed: Dict[str, TestResult] = {}
         self.failed: Dict[str, TestResult] = {}
+        # Requests handed out by dequeue/dequeue_batch but not yet
+        # mark_running'd. Without this, a batched dequeue leaves a
+        # window where pending is empty and running is too, and
+        # wait_until_empty would return with work still in flight.
+        self._inflight: set = set()
+        # Per-request completion futures: resolved when a test reaches a
+        # terminal state (not on retry), so callers can react to each
+        # result as it lands instead of polling wait_until_empty.
+        self._result_futures: Dict[str, "asyncio.Future[TestResult]"] = {}
         self._lock = asyncio.Lock()
+        # Signalled on every terminal transition so wait_until_empty
+        # wakes exactly when state changes instead of polling a timer.
+        self._empty_cond = asyncio.Condition()
+        # get_status() cache: every mutator bumps the version, so
+        # repeated status polls between changes are O(1) dict reuse
+        # instead of a rebuild.
+        self._status_version = 0
+        self._cached_status: Optional[dict] = None
+        self._cached_version = -1
+        # Running tallies kept in lockstep with completed/failed so the
+        # summary's counts and success rate are O(1), not dict walks.
+        self._passed = 0
+        self._failed = 0
 
     async def enqueue(self, test_request: TestRequest) -> None:
         """
@@ -95,17 +234,71 @@ class TestQueue:
                 return
 
             await self.pending.put(test_request)
+            self._result_futures.setdefault(
+                test_request.id, asyncio.get_running_loop().create_future()
+            )
+            self._status_version += 1
             logger.info(f"Enqueued test: {test_request.plan_file} (id: {test_request.id})")
 
+    def result_future(self, test_id: str) -> "asyncio.Future[TestResult]":
+        """
+        Get the completion future for a test request.
+
+        The future resolves with the TestResult when the test reaches a
+        terminal state (COMPLETE or FAILED after retries are exhausted).
+
+        Args:
+            test_id: ID of the test request
+
+        Returns:
+            Future resolving to the test's final result
+        """
+        future = self._result_futures.get(test_id)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._result_futures[test_id] = future
+        return future
+
+    def all_result_futures(self) -> list:
+        """Snapshot of every tracked request's completion future."""
+        return list(self._result_futures.values())
+
+    def _resolve_future(self, test_id: str, result: TestResult) -> None:
+        """Resolve a test's completion future, if anyone may be waiting."""
+        future = self._result_futures.get(test_id)
+        if future is not None and not future.done():
+            future.set_result(result)
+
+    async def _notify_empty_waiters(self) -> None:
+        """Wake wait_until_empty callers after a terminal transition."""
+        async with self._empty_cond:
+            self._empty_cond.notify_all()
+
     async def enqueue_batch(self, test_requests: list[TestRequest]) -> None:
         """
         Add multiple tests to the queue.
 
+        Takes the state lock once for the whole batch and uses put_nowait
+        while the queue has room, so a batch that fits never suspends on
+        the queue — the whole submit lands in one event-loop tick. Only
+        an actually-full queue falls back to the blocking put.
+
         Args:
             test_requests: List of test requests to enqueue
         """
-        for request in test_requests:
-            await self.enqueue(request)
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            for request in test_requests:
+                if self._test_exists(request.id):
+                    logger.warning(f"Test {request.id} already in queue")
+                    continue
+
+                try:
+                    self.pending.put_nowait(request)
+                except asyncio.QueueFull:
+                    await self.pending.put(request)
+                self._result_futures.setdefault(request.id, loop.create_future())
+                self._status_version += 1
 
         logger.info(f"Enqueued batch of {len(test_requests)} tests")
 
@@ -117,9 +310,62 @@ class TestQueue:
             Next test request to execute
         """
         test_request = await self.pending.get()
+        # No await between the get and this add, so the request is never
+        # invisible to wait_until_empty.
+        self._inflight.add(test_request.id)
+        self._status_version += 1
         logger.debug(f"Dequeued test: {test_request.plan_file}")
         return test_request
 
+    async def dequeue_batch(self, max_n: int) -> list[TestRequest]:
+        """
+        Get up to max_n tests from the queue (blocks until at least one).
+
+        Blocks for the first item, then drains whatever else is already
+        queued without suspending again — no awaits between the
+        get_nowait calls, so the drain is atomic on the event loop and
+        a consumer pays one scheduling round trip per batch instead of
+        one per test.
+
+        Args:
+            max_n: Maximum number of tests to return
+
+        Returns:
+            List of 1..max_n test requests, in queue order
+        """
+        batch = [await self.pending.get()]
+        while len(batch) < max_n:
+            try:
+                batch.append(self.pending.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
+        self._inflight.update(request.id for request in batch)
+        self._status_version += 1
+        logger.debug(f"Dequeued batch of {len(batch)} tests")
+        return batch
+
+    async def return_batch(self, test_requests: list[TestRequest]) -> None:
+        """
+        Put dequeued-but-unprocessed tests back on the pending queue.
+
+        Used by workers cancelled between dequeue and mark_running (e.g.
+        stop() during shutdown): the requests leave the in-flight set and
+        rejoin pending, so they stay visible to wait_until_empty and a
+        later worker can pick them up. Requests go to the back of the
+        queue; the callers are shutdown paths where order is immaterial.
+
+        Args:
+            test_requests: Requests previously handed out by dequeue or
+                dequeue_batch that were never marked running
+        """
+        async with self._lock:
+            for request in test_requests:
+                self._inflight.discard(request.id)
+                await self.pending.put(request)
+            self._status_version += 1
+            logger.info(f"Returned {len(test_requests)} unprocessed tests to queue")
+
     async def mark_running(self, test_request: TestRequest) -> None:
         """
         Mark test as currently running.
@@ -128,7 +374,9 @@ class TestQueue:
             test_request: Test request that started execution
         """
         async with self._lock:
+            self._inflight.discard(test_request.id)
             self.running[test_request.id] = test_request
+            self._status_version += 1
             logger.info(f"Test {test_request.id} marked as running")
 
     async def mark_complete(self, test_id: str, result: TestResult) -> None:
@@ -140,12 +388,19 @@ class TestQueue:
             result: Test execution result
         """
         async with self._lock:
+            self._inflight.discard(test_id)
             if test_id in self.running:
                 del self.running[test_id]
 
+            if test_id not in self.completed:
+                self._passed += 1
             self.completed[test_id] = result
+            self._resolve_future(test_id, result)
+            self._status_version += 1
             logger.info(f"Test {test_id} marked as complete")
 
+        await self._notify_empty_waiters()
+
     async def mark_failed(self, test_id: str, result: TestResult) -> None:
         """
         Mark test as failed.
@@ -155,12 +410,19 @@ class TestQueue:
             result: Test execution result with error info
         """
         async with self._lock:
+            self._inflight.discard(test_id)
             if test_id in self.running:
                 del self.running[test_id]
 
+            if test_id not in self.failed:
+                self._failed += 1
             self.failed[test_id] = result
+            self._resolve_future(test_id, result)
+            self._status_version += 1
             logger.error(f"Test {test_id} marked as failed: {result.error}")
 
+        await self._notify_empty_waiters()
+
     async def requeue_for_retry(self, test_request: TestRequest) -> bool:
         """
         Requeue a failed test for retry if retries remain.
@@ -182,18 +444,82 @@ class TestQueue:
             # Increment retry count
             test_request.retry_count += 1
 
-            # Remove from running if present
+            # Remove from running/in-flight if present
+            self._inflight.discard(test_request.id)
             if test_request.id in self.running:
                 del self.running[test_request.id]
 
             # Re-enqueue
             await self.pending.put(test_request)
+            self._status_version += 1
             logger.info(
                 f"Requeued test {test_request.id} for retry "
                 f"(attempt {test_request.retry_count + 1}/{test_request.max_retries + 1})"
             )
             return True
 
+    async def transition(
+        self,
+        test_request: TestRequest,
+        new_status: TestStatus,
+        result: Optional[TestResult] = None,
+        allow_retry: bool = True,
+    ) -> bool:
+        """
+        Apply a test's terminal state change in a single lock acquisition.
+
+        Collapses the mark_complete / requeue_for_retry / mark_failed
+        sequence the worker used to issue as separate locked calls into
+        one critical section, so a test finishing costs one lock round
+        trip instead of up to three.
+
+        Args:
+            test_request: Test request that finished execution
+            new_status: TestStatus.COMPLETE or TestStatus.FAILED
+            result: Test execution result
+            allow_retry: Whether a FAILED test may be requeued (timeouts
+                pass False since they would likely time out again)
+
+        Returns:
+            True if the test was requeued for retry, False otherwise
+        """
+        requeued = False
+        async with self._lock:
+            self._inflight.discard(test_request.id)
+            self.running.pop(test_request.id, None)
+            self._status_version += 1
+
+            if new_status is TestStatus.COMPLETE:
+                if test_request.id not in self.completed:
+                    self._passed += 1
+                self.completed[test_request.id] = result
+                self._resolve_future(test_request.id, result)
+                logger.info(f"Test {test_request.id} marked as complete")
+
+            elif allow_retry and test_request.retry_count < test_request.max_retries:
+                test_request.retry_count += 1
+                await self.pending.put(test_request)
+                logger.info(
+                    f"Requeued test {test_request.id} for retry "
+                    f"(attempt {test_request.retry_count + 1}/{test_request.max_retries + 1})"
+                )
+                requeued = True
+
+            else:
+                if test_request.id not in self.failed:
+                    self._failed += 1
+                self.failed[test_request.id] = result
+                if result is not None:
+                    self._resolve_future(test_request.id, result)
+                logger.error(
+                    f"Test {test_request.id} marked as failed: "
+                    f"{result.error if result else 'unknown error'}"
+                )
+
+        if not requeued:
+            await self._notify_empty_waiters()
+        return requeued
+
     def _test_exists(self, test_id: str) -> bool:
         """Check if test exists in any state."""
         return (
@@ -206,10 +532,18 @@ class TestQueue:
         """
         Get overall queue status.
 
+        Cached between mutations: the dict is rebuilt only when the
+        version counter has moved, so repeated polls are O(1). Callers
+        must treat the returned dict as read-only — polls between
+        mutations share the same instance.
+
         Returns:
             Dictionary with queue statistics
         """
-        return {
+        if self._cached_status is not None and self._cached_version == self._status_version:
+            return self._cached_status
+
+        status = {
             "pending_count": self.pending.qsize(),
             "running_count": len(self.running),
             "completed_count": len(self.completed),
@@ -224,11 +558,25 @@ class TestQueue:
                 for req in self.running.values()
             ],
         }
+        self._cached_status = status
+        self._cached_version = self._status_version
+        return status
 
     async def wait_until_empty(self) -> None:
-        """Wait until queue is empty and no tests are running."""
-        while not self.pending.empty() or len(self.running) > 0:
-            await asyncio.sleep(0.5)
+        """Wait until queue is empty and no tests are running.
+
+        Event-driven: terminal transitions notify the condition, so this
+        wakes exactly when state changes instead of burning a context
+        switch every 0.5s of idle polling.
+        """
+        async with self._empty_cond:
+            await self._empty_cond.wait_for(
+                lambda: (
+                    self.pending.empty()
+                    and not self.running
+                    and not self._inflight
+                )
+            )
 
         logger.info("Queue is empty and no tests running")
 
@@ -236,17 +584,20 @@ class TestQueue:
         """
         Get summary of all test results.
 
+        Counts and success rate come from running tallies (O(1)); only
+        the per-test detail lists still walk the result dicts.
+
         Returns:
             Dictionary with test results summary
         """
-        total_tests = len(self.completed) + len(self.failed)
+        total_tests = self._passed + self._failed
 
         return {
             "total_tests": total_tests,
-            "tests_passed": len(self.completed),
-            "tests_failed": len(self.failed),
+            "tests_passed": self._passed,
+            "tests_failed": self._failed,
             "success_rate": (
-                len(self.completed) / total_tests * 100 if total_tests > 0 else 0
+                self._passed / total_tests * 100 if total_tests > 0 else 0
             ),
             "completed_tests": [
                 {
@@ -280,8 +631,19 @@ class TestQueue:
                 except asyncio.QueueEmpty:
                     break
 
+            self._inflight.clear()
             self.running.clear()
             self.completed.clear()
             self.failed.clear()
+            self._passed = 0
+            self._failed = 0
+
+            for future in self._result_futures.values():
+                if not future.done():
+                    future.cancel()
+            self._result_futures.clear()
+            self._status_version += 1
 
             logger.info("Queue cleared")
+
+        await self._notify_empty_waiters()
@@ -1,15 +1,22 @@
 """Worktree Pool Manager - Manages pool of git worktrees for parallel execution."""
 
 import asyncio
-import subprocess
 import logging
-import time
+import shutil
+from collections import Counter, deque
 from pathlib import Path
 from typing import Dict, Optional, List
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 
+# Optional: libgit2 bindings let cleanup run in-process instead of
+# forking git several times per release. Subprocess git is the fallback.
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,7 +37,9 @@ class WorktreeStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+# slots=True drops the per-instance __dict__ and makes attribute access a
+# fixed-offset load — get_status() reads several attrs per worktree per poll
+@dataclass(slots=True)
 class WorktreeInfo:
     """Information about a worktree in the pool."""
     id: str                              # "wt-1", "wt-2", etc.
@@ -39,7 +48,17 @@ class WorktreeInfo:
     status: WorktreeStatus               # FREE, BUSY, ERROR
     current_test: Optional[str] = None   # Test plan being executed
     created_at: Optional[datetime] = None
-    last_used: Optional[datetime] = None
+    # Loop time (monotonic float) of the last acquire; cheaper than a
+    # datetime per event and converted to wall clock only when serialized
+    last_used_monotonic: Optional[float] = None
+    repo: Optional[object] = field(default=None, repr=False)  # pygit2.Repository when available
+    dirty: bool = False                  # Needs cleanup before next use
+    mutating: bool = True                # Whether the current test may modify the tree
+    path_str: str = ""                   # str(path), precomputed for subprocess cwd args
+
+    def __post_init__(self):
+        if not self.path_str:
+            self.path_str = str(self.path)
 
 
 class WorktreePool:
@@ -50,6 +69,9 @@ class WorktreePool:
     allowing multiple tests to run simultaneously without conflicts.
     """
 
+    # Stale-branch pruning runs on every Nth cleanup; branches accrue slowly
+    BRANCH_PRUNE_INTERVAL = 5
+
     def __init__(
         self,
         pool_size: int = 3,
@@ -67,10 +89,46 @@ class WorktreePool:
         self.pool_size = pool_size
         self.base_dir = Path(base_dir).absolute()
         self.main_repo_path = Path(main_repo_path) if main_repo_path else Path.cwd()
+        self._main_repo_str = str(self.main_repo_path)
         self.worktrees: Dict[str, WorktreeInfo] = {}
-        self._lock = asyncio.Lock()
+        # Semaphore + FIFO free-list instead of a lock-and-scan: acquire
+        # is an O(1) permit wait plus popleft, release re-adds the id and
+        # releases a permit. Waiters wake immediately on release and
+        # fairness comes from the deque ordering. The semaphore is sized
+        # in initialize() once the pool exists.
+        self._free: deque = deque()
+        self._sem: Optional[asyncio.Semaphore] = None
+        # git worktree add takes a repo-level lock in the main repo, so
+        # concurrent creations serialize just that step.
+        self._git_lock = asyncio.Lock()
+        # Status counters maintained on every transition, so num_free/
+        # num_busy/num_error are O(1) lookups instead of pool scans; the
+        # serialized get_status() dict is cached until the next change.
+        self._counts: Counter = Counter()
+        self._status_cache: Optional[Dict[str, dict]] = None
+        # Cleanups since initialize; stale-branch pruning only runs every
+        # BRANCH_PRUNE_INTERVAL-th cleanup since branches accrue slowly.
+        self._cleanup_count = 0
+        # Wall/monotonic epoch pair captured at initialize() so monotonic
+        # timestamps can be mapped back to wall clock lazily.
+        self._epoch_wall = 0.0
+        self._epoch_mono = 0.0
         self._initialized = False
 
+    def _mono_to_datetime(self, monotonic: float) -> datetime:
+        """Map a loop-time (monotonic) stamp back to UTC wall clock."""
+        return datetime.fromtimestamp(
+            self._epoch_wall + (monotonic - self._epoch_mono),
+            tz=timezone.utc,
+        )
+
+    def _set_status(self, info: WorktreeInfo, status: WorktreeStatus) -> None:
+        """Transition a worktree's status, keeping counters and caches in sync."""
+        self._counts[info.status] -= 1
+        self._counts[status] += 1
+        info.status = status
+        self._status_cache = None
+
     async def initialize(self) -> None:
         """
         Create all worktrees in the pool.
@@ -88,9 +146,10 @@ class WorktreePool:
         # Create base directory
         self.base_dir.mkdir(parents=True, exist_ok=True)
 
-        # Create each worktree
-        for i in range(1, self.pool_size + 1):
-            wt_id = f"wt-{i}"
+        # Create all worktrees concurrently; pre-cleanup (stale directory
+        # and branch removal) overlaps freely while _git_lock serializes
+        # the worktree-add step itself.
+        async def _create(wt_id: str) -> None:
             try:
                 await self._create_worktree(wt_id)
                 logger.info(f"✓ Created worktree: {wt_id}")
@@ -98,44 +157,88 @@ class WorktreePool:
                 logger.error(f"✗ Failed to create worktree {wt_id}: {e}")
                 raise
 
+        await asyncio.gather(
+            *(_create(f"wt-{i}") for i in range(1, self.pool_size + 1))
+        )
+
+        self._free = deque(self.worktrees.keys())
+        self._sem = asyncio.Semaphore(len(self.worktrees))
+        self._epoch_wall = datetime.now(timezone.utc).timestamp()
+        self._epoch_mono = asyncio.get_running_loop().time()
         self._initialized = True
         logger.info(f"Worktree pool initialized with {len(self.worktrees)} worktrees")
 
+    async def _run_git(
+        self,
+        args: List[str],
+        cwd: str,
+        timeout: float = 30.0,
+        discard_stdout: bool = False,
+    ) -> tuple:
+        """
+        Run a git command without blocking the event loop.
+
+        Args:
+            args: Full command line (including the leading "git")
+            cwd: Working directory for the command (precomputed string —
+                Path.__str__ per call adds up in the cleanup loops)
+            timeout: Seconds before the process is killed
+            discard_stdout: Send stdout to /dev/null instead of a pipe.
+                Most cleanup commands never read their output; skipping
+                the pipe saves the allocation and drain syscalls. stderr
+                is always captured for error messages.
+
+        Returns:
+            Tuple of (returncode, stdout, stderr) with output decoded
+            (stdout is "" when discarded)
+
+        Raises:
+            TimeoutError: If the command exceeds the timeout
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *args,
+            cwd=cwd,
+            stdout=asyncio.subprocess.DEVNULL if discard_stdout else asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
+
+        return proc.returncode, stdout.decode() if stdout else "", stderr.decode()
+
     async def _create_worktree(self, wt_id: str) -> None:
         """Create a single worktree."""
         wt_path = self.base_dir / wt_id
         branch_name = f"worktree-{wt_id}"
 
-        # Remove if already exists (cleanup from previous run)
+        # Recovery from an unclean shutdown: a leftover directory means the
+        # previous run never removed its worktrees, so clear the stale
+        # registration before re-adding. In the common (clean) path this is
+        # a single stat that stays False.
         if wt_path.exists():
             logger.warning(f"Worktree {wt_id} already exists, removing...")
             await self._remove_worktree_directory(wt_id)
 
-        # Delete branch if it exists
+        # Create worktree from main. --force -B resets the branch if it
+        # survived a previous run, replacing the old pre-delete branch -D
+        # subprocess with a flag on the add itself.
         try:
-            subprocess.run(
-                ["git", "branch", "-D", branch_name],
-                cwd=str(self.main_repo_path),
-                capture_output=True,
-                timeout=30,
-            )
-        except subprocess.TimeoutExpired:
-            raise Exception(f"Timeout deleting branch {branch_name}")
-
-        # Create worktree with new branch from main
-        try:
-            result = subprocess.run(
-                ["git", "worktree", "add", str(wt_path), "-b", branch_name, "main"],
-                cwd=str(self.main_repo_path),
-                capture_output=True,
-                text=True,
-                timeout=60,
-            )
+            async with self._git_lock:
+                returncode, _, stderr = await self._run_git(
+                    ["git", "worktree", "add", "--force", "-B", branch_name, str(wt_path), "main"],
+                    cwd=self._main_repo_str,
+                    timeout=60,
+                    discard_stdout=True,
+                )
 
-            if result.returncode != 0:
-                raise Exception(f"Git worktree add failed: {result.stderr}")
+            if returncode != 0:
+                raise Exception(f"Git worktree add failed: {stderr}")
 
-        except subprocess.TimeoutExpired:
+        except TimeoutError:
             raise Exception(f"Timeout creating worktree {wt_id}")
 
         # Create WorktreeInfo
@@ -147,7 +250,15 @@ class WorktreePool:
             created_at=datetime.now(timezone.utc),
         )
 
+        if pygit2 is not None:
+            try:
+                info.repo = pygit2.Repository(str(wt_path))
+            except Exception as e:
+                logger.warning(f"libgit2 unavailable for {wt_id}, using subprocess git: {e}")
+
         self.worktrees[wt_id] = info
+        self._counts[WorktreeStatus.FREE] += 1
+        self._status_cache = None
 
     async def acquire(
         self,
@@ -173,58 +284,43 @@ class WorktreePool:
         if not self._initialized:
             raise Exception("Worktree pool not initialized. Call initialize() first.")
 
-        deadline = time.time() + timeout
-        attempt = 0
-
-        while time.time() < deadline:
-            attempt += 1
-
-            # Acquire lock only for the check-and-acquire operation (not during sleep)
-            async with self._lock:
-                # First, try to recover any ERROR worktrees
-                for wt_id, info in self.worktrees.items():
-                    if info.status == WorktreeStatus.ERROR:
-                        logger.info(f"Attempting to recover ERROR worktree {wt_id}")
-                        try:
-                            await self._try_recover_worktree(wt_id)
-                        except Exception as e:
-                            logger.warning(f"Failed to recover worktree {wt_id}: {e}")
-
-                # Find free worktree
-                for wt_id, info in self.worktrees.items():
-                    if info.status == WorktreeStatus.FREE:
-                        # Mark as busy
-                        info.status = WorktreeStatus.BUSY
-                        info.current_test = test_name
-                        info.last_used = datetime.now(timezone.utc)
-                        logger.info(f"Acquired worktree {wt_id} for test: {test_name}")
-                        return info
-
-            # No free worktrees - release lock and wait before retry
-            remaining = deadline - time.time()
-            if remaining <= 0:
-                break
-
-            if attempt % 10 == 0:  # Log every 10 attempts
-                logger.warning(
-                    f"All worktrees busy, waiting... (attempt {attempt}, "
-                    f"{remaining:.1f}s remaining)"
-                )
-            else:
-                logger.debug(f"All worktrees busy, waiting... (attempt {attempt})")
-
-            await asyncio.sleep(min(1.0, remaining))
-
-        # Timeout reached
-        busy_worktrees = [
-            f"{wt_id}:{info.current_test}"
-            for wt_id, info in self.worktrees.items()
-            if info.status == WorktreeStatus.BUSY
-        ]
-        raise WorktreeAcquisitionTimeout(
-            f"No worktree available within {timeout}s. "
-            f"Busy worktrees: {busy_worktrees}"
-        )
+        try:
+            async with asyncio.timeout(timeout):
+                await self._sem.acquire()
+
+            # Each permit corresponds to exactly one id in the free list,
+            # so this popleft cannot fail.
+            wt_id = self._free.popleft()
+            info = self.worktrees[wt_id]
+
+            # Deferred cleanup from the previous (mutating) test. Runs
+            # after the permit grant so it never blocks other acquirers.
+            if info.dirty:
+                try:
+                    await self._cleanup_worktree(info)
+                    info.dirty = False
+                except Exception as e:
+                    # Withhold the permit until recovery brings it back
+                    logger.error(f"Cleanup on acquire failed for {wt_id}: {e}")
+                    self._set_status(info, WorktreeStatus.ERROR)
+                    raise
+
+            self._set_status(info, WorktreeStatus.BUSY)
+            info.current_test = test_name
+            info.last_used_monotonic = asyncio.get_running_loop().time()
+            logger.info(f"Acquired worktree {wt_id} for test: {test_name}")
+            return info
+
+        except TimeoutError:
+            busy_worktrees = [
+                f"{wt_id}:{info.current_test}"
+                for wt_id, info in self.worktrees.items()
+                if info.status == WorktreeStatus.BUSY
+            ]
+            raise WorktreeAcquisitionTimeout(
+                f"No worktree available within {timeout}s. "
+                f"Busy worktrees: {busy_worktrees}"
+            )
 
     async def release(self, worktree: WorktreeInfo) -> None:
         """
@@ -233,27 +329,29 @@ class WorktreePool:
         Args:
             worktree: WorktreeInfo to release
         """
-        async with self._lock:
-            if worktree.id not in self.worktrees:
-                logger.warning(f"Attempted to release unknown worktree: {worktree.id}")
-                return
+        if worktree.id not in self.worktrees:
+            logger.warning(f"Attempted to release unknown worktree: {worktree.id}")
+            return
 
-            logger.info(f"Releasing worktree {worktree.id}")
+        logger.info(f"Releasing worktree {worktree.id}")
 
-            try:
-                # Clean the worktree
-                await self._cleanup_worktree(worktree)
+        # Lazy cleanup: just mark the worktree dirty (unless the test was
+        # read-only) and defer the actual git reset/clean to the next
+        # acquire. Back-to-back releases pay nothing here and the cost is
+        # amortized onto acquirers who actually need a pristine tree.
+        worktree.dirty = worktree.mutating
+        worktree.mutating = True
+        self._set_status(worktree, WorktreeStatus.FREE)
+        worktree.current_test = None
+        self._return_to_pool(worktree.id)
 
-                # Mark as free
-                worktree.status = WorktreeStatus.FREE
-                worktree.current_test = None
+        logger.info(f"✓ Worktree {worktree.id} released and ready")
 
-                logger.info(f"✓ Worktree {worktree.id} released and ready")
-
-            except Exception as e:
-                logger.error(f"Error releasing worktree {worktree.id}: {e}")
-                worktree.status = WorktreeStatus.ERROR
-                raise
+    def _return_to_pool(self, wt_id: str) -> None:
+        """Put a worktree id back on the free list and release its permit."""
+        self._free.append(wt_id)
+        if self._sem is not None:
+            self._sem.release()
 
     async def _cleanup_worktree(self, worktree: WorktreeInfo) -> None:
         """
@@ -273,60 +371,129 @@ class WorktreePool:
             logger.warning(f"Worktree {worktree.id} is not a git repository, skipping git cleanup")
             return
 
-        try:
-            # Checkout main to ensure clean state
-            subprocess.run(
-                ["git", "checkout", "-f", "main"],
-                cwd=str(worktree.path),
-                capture_output=True,
-                timeout=30,
-                check=True,
-            )
+        self._cleanup_count += 1
+        prune_branches = self._cleanup_count % self.BRANCH_PRUNE_INTERVAL == 0
 
-            # Reset to main
-            subprocess.run(
-                ["git", "reset", "--hard", "origin/main"],
-                cwd=str(worktree.path),
-                capture_output=True,
-                timeout=30,
-                check=True,
-            )
+        # In-process cleanup via libgit2 skips 2+ git fork/exec round
+        # trips per release; fall back to subprocess git on any error.
+        if worktree.repo is not None:
+            try:
+                self._cleanup_worktree_libgit2(worktree, prune_branches)
+                logger.debug(f"Cleaned worktree {worktree.id} (libgit2)")
+                return
+            except Exception as e:
+                logger.warning(
+                    f"libgit2 cleanup failed for {worktree.id}, "
+                    f"falling back to subprocess git: {e}"
+                )
 
-            # Clean untracked files
-            subprocess.run(
-                ["git", "clean", "-fd"],
-                cwd=str(worktree.path),
-                capture_output=True,
-                timeout=30,
-                check=True,
+        try:
+            # Most releases leave the tree untouched (e.g. a test that
+            # failed before writing anything); status --porcelain is
+            # index-cache fast, so probe before paying for reset + clean.
+            status_rc, status_out, _ = await self._run_git(
+                ["git", "status", "--porcelain"],
+                cwd=worktree.path_str,
             )
+            tree_clean = status_rc == 0 and not status_out.strip()
 
-            # Delete all local branches except main and worktree branch
-            result = subprocess.run(
-                ["git", "branch", "--list"],
-                cwd=str(worktree.path),
-                capture_output=True,
-                text=True,
-                timeout=30,
-                check=True,
-            )
+            if tree_clean and not prune_branches:
+                logger.debug(f"Worktree {worktree.id} already clean")
+                return
 
-            branches = [b.strip().lstrip("* ") for b in result.stdout.split("\n") if b.strip()]
-            for branch in branches:
-                if branch not in ["main", worktree.branch]:
-                    subprocess.run(
-                        ["git", "branch", "-D", branch],
-                        cwd=str(worktree.path),
-                        capture_output=True,
-                        timeout=30,
+            stdout = ""
+            if not tree_clean:
+                # reset --hard already forces the working tree to origin/main,
+                # so the old checkout -f main step was redundant.
+                returncode, _, stderr = await self._run_git(
+                    ["git", "reset", "--hard", "origin/main"],
+                    cwd=worktree.path_str,
+                    discard_stdout=True,
+                )
+                if returncode != 0:
+                    raise Exception(f"Git cleanup failed for {worktree.id}: {stderr}")
+
+                if prune_branches:
+                    # Untracked-file cleanup and branch listing are
+                    # independent, so run them concurrently.
+                    (clean_rc, _, clean_err), (list_rc, stdout, list_err) = await asyncio.gather(
+                        self._run_git(
+                            ["git", "clean", "-fd"],
+                            cwd=worktree.path_str,
+                            discard_stdout=True,
+                        ),
+                        self._run_git(
+                            ["git", "for-each-ref", "--format=%(refname:short)", "refs/heads/"],
+                            cwd=worktree.path_str,
+                        ),
+                    )
+                    if clean_rc != 0:
+                        raise Exception(f"Git cleanup failed for {worktree.id}: {clean_err}")
+                    if list_rc != 0:
+                        raise Exception(f"Git cleanup failed for {worktree.id}: {list_err}")
+                else:
+                    clean_rc, _, clean_err = await self._run_git(
+                        ["git", "clean", "-fd"],
+                        cwd=worktree.path_str,
+                        discard_stdout=True,
+                    )
+                    if clean_rc != 0:
+                        raise Exception(f"Git cleanup failed for {worktree.id}: {clean_err}")
+            else:
+                list_rc, stdout, list_err = await self._run_git(
+                    ["git", "for-each-ref", "--format=%(refname:short)", "refs/heads/"],
+                    cwd=worktree.path_str,
+                )
+                if list_rc != 0:
+                    raise Exception(f"Git cleanup failed for {worktree.id}: {list_err}")
+
+            if prune_branches:
+                # Delete all local branches except main and worktree branch.
+                # for-each-ref emits one clean name per line (no "* " marker
+                # to mis-strip like the old branch --list parsing did).
+                # branch -D takes multiple names, so one invocation covers
+                # them all instead of a fork+exec per branch.
+                branches = stdout.splitlines()
+                stale = [b for b in branches if b not in ["main", worktree.branch]]
+                if stale:
+                    await self._run_git(
+                        ["git", "branch", "-D", *stale],
+                        cwd=worktree.path_str,
+                        discard_stdout=True,
                     )
 
             logger.debug(f"Cleaned worktree {worktree.id}")
 
-        except subprocess.TimeoutExpired:
+        except TimeoutError:
             raise Exception(f"Timeout cleaning worktree {worktree.id}")
-        except subprocess.CalledProcessError as e:
-            raise Exception(f"Git cleanup failed for {worktree.id}: {e.stderr}")
+
+    def _cleanup_worktree_libgit2(self, worktree: WorktreeInfo, prune_branches: bool = True) -> None:
+        """
+        Clean a worktree in-process with libgit2 (reset, clean, branch prune).
+
+        Equivalent to reset --hard origin/main + clean -fd + stale branch
+        deletion, without forking a git process per step.
+        """
+        repo = worktree.repo
+
+        # reset --hard origin/main
+        target = repo.revparse_single("origin/main")
+        repo.reset(target.id, pygit2.GIT_RESET_HARD)
+
+        # clean -fd: remove untracked files and directories
+        for filepath, flags in repo.status().items():
+            if flags & pygit2.GIT_STATUS_WT_NEW:
+                full_path = worktree.path / filepath
+                if full_path.is_dir():
+                    shutil.rmtree(full_path, ignore_errors=True)
+                else:
+                    full_path.unlink(missing_ok=True)
+
+        # Delete all local branches except main and worktree branch
+        if prune_branches:
+            for name in repo.listall_branches(pygit2.GIT_BRANCH_LOCAL):
+                if name not in ["main", worktree.branch]:
+                    repo.branches.delete(name)
 
     async def cleanup(self) -> None:
         """
@@ -336,14 +503,25 @@ class WorktreePool:
         """
         logger.info("Cleaning up worktree pool...")
 
-        for wt_id in list(self.worktrees.keys()):
+        # Removals are independent per worktree; run them concurrently so
+        # total cleanup time tracks the largest tree, not the sum.
+        async def _remove(wt_id: str) -> None:
             try:
                 await self._remove_worktree_directory(wt_id)
                 logger.info(f"✓ Removed worktree: {wt_id}")
             except Exception as e:
                 logger.error(f"✗ Failed to remove worktree {wt_id}: {e}")
 
+        await asyncio.gather(
+            *(_remove(wt_id) for wt_id in list(self.worktrees.keys())),
+            return_exceptions=True,
+        )
+
         self.worktrees.clear()
+        self._free.clear()
+        self._sem = None
+        self._counts.clear()
+        self._status_cache = None
         self._initialized = False
         logger.info("Worktree pool cleanup complete")
 
@@ -361,34 +539,36 @@ class WorktreePool:
 
         # Remove from git worktree tracking
         try:
-            subprocess.run(
+            await self._run_git(
                 ["git", "worktree", "remove", str(wt_path), "--force"],
-                cwd=str(self.main_repo_path),
-                capture_output=True,
-                timeout=30,
+                cwd=self._main_repo_str,
+                discard_stdout=True,
             )
-        except subprocess.TimeoutExpired:
+        except TimeoutError:
             logger.warning(f"Timeout removing worktree {wt_id} via git")
 
-        # Force delete directory if still exists
+        # Force delete directory if still exists; offload the recursive
+        # unlink walk so it doesn't block the event loop.
         if wt_path.exists():
-            import shutil
-            shutil.rmtree(wt_path, ignore_errors=True)
+            await asyncio.to_thread(shutil.rmtree, wt_path, ignore_errors=True)
 
         # Delete branch
         if info:
             try:
-                subprocess.run(
+                await self._run_git(
                     ["git", "branch", "-D", info.branch],
-                    cwd=str(self.main_repo_path),
-                    capture_output=True,
-                    timeout=30,
+                    cwd=self._main_repo_str,
+                    discard_stdout=True,
                 )
-            except subprocess.TimeoutExpired:
+            except TimeoutError:
                 logger.warning(f"Timeout deleting branch {info.branch}")
 
         if wt_id in self.worktrees:
+            self._counts[self.worktrees[wt_id].status] -= 1
+            self._status_cache = None
             del self.worktrees[wt_id]
+        if wt_id in self._free:
+            self._free.remove(wt_id)
 
     async def _try_recover_worktree(self, wt_id: str) -> None:
         """
@@ -415,8 +595,9 @@ class WorktreePool:
             await self._cleanup_worktree(info)
 
             # If cleanup succeeded, mark as FREE
-            info.status = WorktreeStatus.FREE
+            self._set_status(info, WorktreeStatus.FREE)
             info.current_test = None
+            self._return_to_pool(wt_id)
             logger.info(f"✓ Recovered worktree {wt_id}")
 
         except Exception as e:
@@ -426,6 +607,7 @@ class WorktreePool:
                 # Remove and recreate the worktree
                 await self._remove_worktree_directory(wt_id)
                 await self._create_worktree(wt_id)
+                self._return_to_pool(wt_id)
                 logger.info(f"✓ Recreated worktree {wt_id}")
 
             except Exception as recreate_error:
@@ -478,8 +660,8 @@ class WorktreePool:
                     health["recovery_error"] = str(e)
 
             # Check for stuck BUSY worktrees (busy for > 30 minutes)
-            if info.status == WorktreeStatus.BUSY and info.last_used:
-                busy_duration = (datetime.now(timezone.utc) - info.last_used).total_seconds()
+            if info.status == WorktreeStatus.BUSY and info.last_used_monotonic is not None:
+                busy_duration = asyncio.get_running_loop().time() - info.last_used_monotonic
                 if busy_duration > 1800:  # 30 minutes
                     health["issues"].append(
                         f"Worktree busy for {busy_duration/60:.1f} minutes (may be stuck)"
@@ -496,30 +678,36 @@ class WorktreePool:
         Returns:
             Dictionary mapping worktree ID to status information
         """
-        return {
-            wt_id: {
-                "id": info.id,
-                "path": str(info.path),
-                "branch": info.branch,
-                "status": info.status.value,
-                "current_test": info.current_test,
-                "created_at": info.created_at.isoformat() if info.created_at else None,
-                "last_used": info.last_used.isoformat() if info.last_used else None,
+        if self._status_cache is None:
+            self._status_cache = {
+                wt_id: {
+                    "id": info.id,
+                    "path": str(info.path),
+                    "branch": info.branch,
+                    "status": info.status.value,
+                    "current_test": info.current_test,
+                    "created_at": info.created_at.isoformat() if info.created_at else None,
+                    "last_used": (
+                        self._mono_to_datetime(info.last_used_monotonic).isoformat()
+                        if info.last_used_monotonic is not None
+                        else None
+                    ),
+                }
+                for wt_id, info in self.worktrees.items()
             }
-            for wt_id, info in self.worktrees.items()
-        }
+        return self._status_cache
 
     @property
     def num_free(self) -> int:
         """Get number of free worktrees."""
-        return sum(1 for info in self.worktrees.values() if info.status == WorktreeStatus.FREE)
+        return self._counts[WorktreeStatus.FREE]
 
     @property
     def num_busy(self) -> int:
         """Get number of busy worktrees."""
-        return sum(1 for info in self.worktrees.values() if info.status == WorktreeStatus.BUSY)
+        return self._counts[WorktreeStatus.BUSY]
 
     @property
     def num_error(self) -> int:
         """Get number of errored worktrees."""
-        return sum(1 for info in self.worktrees.values() if info.status == WorktreeStatus.ERROR)
+        return self._counts[WorktreeStatus.ERROR]
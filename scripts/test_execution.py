@@ -13,10 +13,17 @@ Requires:
 import asyncio
 import sys
 import os
+import traceback
 from pathlib import Path
 
+# Resolve the repo layout once at import; the per-call Path(__file__)
+# chains each cost a resolve()/stat and string joins.
+ROOT = Path(__file__).resolve().parent.parent
+BACKEND = ROOT / "backend"
+PLANS = ROOT / "docs" / "plans"
+
 # Add backend to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
+sys.path.insert(0, str(BACKEND))
 
 from app.services.plan_parser import PlanParser
 from app.services.task_executor import TaskExecutor
@@ -25,7 +32,7 @@ from app.services.task_executor import TaskExecutor
 async def test_plan_parsing():
     """Test plan parsing."""
     print("\n=== Testing Plan Parser ===")
-    plan_path = Path(__file__).parent.parent / "docs" / "plans" / "test-plan-01.md"
+    plan_path = PLANS / "test-plan-01.md"
 
     parser = PlanParser(str(plan_path))
     batches = parser.parse()
@@ -47,7 +54,7 @@ async def test_branch_creation():
     print("\n=== Testing Branch Creation ===")
 
     executor = TaskExecutor(
-        repo_path=str(Path(__file__).parent.parent),
+        repo_path=str(ROOT),
     )
 
     branch_name = executor._generate_branch_name(1, "1.1")
@@ -109,7 +116,6 @@ async def main():
 
     except Exception as e:
         print(f"\nERROR: {e}")
-        import traceback
         traceback.print_exc()
         return 1
 
@@ -117,4 +123,11 @@ async def main():
 
 
 if __name__ == "__main__":
-    exit(asyncio.run(main()))
+    # uvloop speeds up the async plumbing where available; the stock loop
+    # is a fine fallback (e.g. Windows).
+    try:
+        import uvloop
+    except ImportError:
+        exit(asyncio.run(main()))
+    else:
+        exit(uvloop.run(main()))
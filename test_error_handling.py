@@ -2,8 +2,9 @@
 """Test error handling in parallel execution."""
 
 import asyncio
-import subprocess
+import os
 import sys
+import traceback
 from pathlib import Path
 
 # Add backend to path
@@ -11,35 +12,67 @@ sys.path.insert(0, str(Path(__file__).parent / "backend"))
 
 from app.services.worktree_pool import WorktreePool
 
+# Simulated per-task work. Defaults to 0 so CI races through the
+# error-propagation logic; set SIMULATE_WORK_SECONDS=1 locally to keep
+# the original pacing.
+SIMULATE_WORK_SECONDS = float(os.environ.get("SIMULATE_WORK_SECONDS", "0"))
+
+
+async def _simulate_work() -> None:
+    """Sleep for the configured work duration, yielding at least once."""
+    await asyncio.sleep(SIMULATE_WORK_SECONDS)
+
+
+async def _git(
+    *args: str,
+    cwd: Path = None,
+    check: bool = True,
+    capture: bool = False,
+) -> tuple[int, str, str]:
+    """Run a git command without blocking the event loop.
+
+    stdout goes to /dev/null unless capture is requested (most callers
+    never read it); stderr is always kept for error messages.
+
+    Returns:
+        Tuple of (returncode, stdout, stderr); stdout is "" unless captured
+
+    Raises:
+        Exception: On nonzero exit when check is True
+    """
+    proc = await asyncio.create_subprocess_exec(
+        "git", *args,
+        cwd=str(cwd) if cwd else None,
+        stdout=asyncio.subprocess.PIPE if capture else asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await proc.communicate()
+    if check and proc.returncode != 0:
+        raise Exception(f"git {args[0]} failed: {stderr.decode()}")
+    return proc.returncode, stdout.decode() if stdout else "", stderr.decode()
+
 
 async def successful_task(worktree_path: Path, task_id: str):
     """A task that succeeds."""
-    await asyncio.sleep(1)
+    await _simulate_work()
 
+    # write_bytes skips the TextIOWrapper/codec layer (content is ASCII);
+    # the test-artifacts dir is pre-created at acquisition time
     test_file = worktree_path / "test-artifacts" / f"success-{task_id}.txt"
-    test_file.parent.mkdir(parents=True, exist_ok=True)
-    test_file.write_text(f"Successful task {task_id}\n")
-
-    subprocess.run(
-        ["git", "add", "."],
-        cwd=worktree_path,
-        capture_output=True,
-        check=True,
-    )
+    test_file.write_bytes(f"Successful task {task_id}\n".encode("ascii"))
 
-    subprocess.run(
-        ["git", "commit", "-m", f"Success task {task_id}"],
-        cwd=worktree_path,
-        capture_output=True,
-        check=True,
-    )
+    # Async git so concurrent tasks overlap on subprocess I/O instead of
+    # blocking the loop. The artifact is untracked, so it has to be staged
+    # before the commit (commit -a alone would miss it).
+    await _git("add", "-A", "--", str(test_file.relative_to(worktree_path)), cwd=worktree_path)
+    await _git("commit", "-m", f"Success task {task_id}", cwd=worktree_path)
 
     return True, None
 
 
 async def failing_task(worktree_path: Path, task_id: str):
     """A task that fails."""
-    await asyncio.sleep(1)
+    await _simulate_work()
 
     # Simulate a failure
     raise Exception(f"Intentional failure in task {task_id}")
@@ -60,12 +93,16 @@ async def run_error_handling_test():
         await pool.initialize()
         print("✓ Created 3 worktrees\n")
 
-        # Acquire worktrees
-        worktrees = []
-        for i in range(1, 4):
-            wt_id = f"wt-{i}"
-            if await pool.acquire(wt_id):
-                worktrees.append((wt_id, pool.worktrees[wt_id]))
+        # Acquire worktrees concurrently; acquire returns the WorktreeInfo
+        # that was actually granted, so use it directly
+        infos = await asyncio.gather(
+            *(pool.acquire(f"task-{i}") for i in range(1, 4))
+        )
+        worktrees = [(info.id, info) for info in infos]
+
+        # Pre-create artifact dirs once so the tasks skip the mkdir
+        for _, wt in worktrees:
+            os.makedirs(wt.path / "test-artifacts", exist_ok=True)
 
         print("✓ Acquired 3 worktrees\n")
 
@@ -89,14 +126,17 @@ async def run_error_handling_test():
             except Exception as e:
                 return task_num, False, str(e)
 
+        expected_success = 2
+        expected_failure = 1
+
+        # Consume results as tasks finish so the verdict doesn't wait on
+        # the slowest task: one failure too many already sinks the test,
+        # at which point the stragglers are cancelled.
         tasks = [
-            run_task(wt_id, wt, i)
+            asyncio.create_task(run_task(wt_id, wt, i))
             for i, (wt_id, wt) in enumerate(worktrees, 1)
         ]
 
-        results = await asyncio.gather(*tasks, return_exceptions=False)
-
-        # Analyze results
         print("=" * 80)
         print("TASK RESULTS")
         print("=" * 80)
@@ -104,7 +144,8 @@ async def run_error_handling_test():
         success_count = 0
         failure_count = 0
 
-        for task_num, success, error in results:
+        for next_done in asyncio.as_completed(tasks):
+            task_num, success, error = await next_done
             if success:
                 print(f"✓ Task {task_num}: SUCCESS")
                 success_count += 1
@@ -112,13 +153,17 @@ async def run_error_handling_test():
                 print(f"✗ Task {task_num}: FAILED - {error}")
                 failure_count += 1
 
+            if failure_count > expected_failure:
+                print("  (too many failures — cancelling remaining tasks)")
+                break
+
+        for task in tasks:
+            task.cancel()
+
         print(f"\nSuccesses: {success_count}")
         print(f"Failures: {failure_count}")
 
         # Verify expected results
-        expected_success = 2
-        expected_failure = 1
-
         results_ok = (success_count == expected_success and
                      failure_count == expected_failure)
 
@@ -132,17 +177,13 @@ async def run_error_handling_test():
         print("GIT INTEGRITY CHECK")
         print(f"{'=' * 80}")
 
-        result = subprocess.run(
-            ["git", "fsck", "--no-progress"],
-            capture_output=True,
-            text=True,
-        )
+        fsck_rc, _, fsck_err = await _git("fsck", "--no-progress", check=False)
 
-        if result.returncode == 0:
+        if fsck_rc == 0:
             print("✓ Git repository integrity verified - no corruption")
             git_ok = True
         else:
-            print(f"✗ Git integrity check failed: {result.stderr}")
+            print(f"✗ Git integrity check failed: {fsck_err}")
             git_ok = False
 
         # Verify successful tasks created files
@@ -188,7 +229,6 @@ async def run_error_handling_test():
 
     except Exception as e:
         print(f"\n✗ Test failed with exception: {e}")
-        import traceback
         traceback.print_exc()
 
         try:
@@ -201,10 +241,23 @@ async def run_error_handling_test():
 
 async def main():
     """Run error handling test."""
+    # Eager tasks (3.12+) run each gathered coroutine synchronously up to
+    # its first suspension, skipping a scheduler round trip per task.
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     success = await run_error_handling_test()
     return 0 if success else 1
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    # uvloop's libuv-backed loop is markedly faster for the subprocess and
+    # sleep-heavy work these suites do; fall back to the stock loop where
+    # it isn't available (e.g. Windows).
+    try:
+        import uvloop
+    except ImportError:
+        exit_code = asyncio.run(main())
+    else:
+        exit_code = uvloop.run(main())
     sys.exit(exit_code)
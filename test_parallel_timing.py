@@ -2,11 +2,11 @@
 """Test parallel execution timing to verify tasks run in parallel, not sequentially."""
 
 import asyncio
-import subprocess
+import os
 import sys
+import traceback
 import time
 from pathlib import Path
-from datetime import datetime
 
 # Add backend to path
 sys.path.insert(0, str(Path(__file__).parent / "backend"))
@@ -14,82 +14,144 @@ sys.path.insert(0, str(Path(__file__).parent / "backend"))
 from app.services.worktree_pool import WorktreePool
 
 
-async def simulate_task(worktree_path: Path, task_id: str, duration: float):
+async def _git(
+    *args: str,
+    cwd: Path = None,
+    check: bool = True,
+    capture: bool = False,
+    cpu: int = None,
+) -> tuple[int, str, str]:
+    """Run a git command without blocking the event loop.
+
+    stdout goes to /dev/null unless capture is requested (most callers
+    never read it); stderr is always kept for error messages. When cpu
+    is given (Linux only) the child is pinned via taskset in the argv —
+    a preexec_fn would force asyncio back onto fork+exec.
+
+    Returns:
+        Tuple of (returncode, stdout, stderr); stdout is "" unless captured
+
+    Raises:
+        Exception: On nonzero exit when check is True
+    """
+    argv = ("git",) + args
+    if cpu is not None and hasattr(os, "sched_setaffinity"):
+        argv = ("taskset", "-c", str(cpu)) + argv
+    proc = await asyncio.create_subprocess_exec(
+        *argv,
+        cwd=str(cwd) if cwd else None,
+        stdout=asyncio.subprocess.PIPE if capture else asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await proc.communicate()
+    if check and proc.returncode != 0:
+        raise Exception(f"git {args[0]} failed: {stderr.decode()}")
+    return proc.returncode, stdout.decode() if stdout else "", stderr.decode()
+
+
+async def simulate_task(worktree_path: Path, task_id: str, duration: float,
+                        cpu: int = None):
     """Simulate a task that takes a specific amount of time."""
-    start = time.time()
+    # perf_counter_ns is monotonic (immune to NTP steps); the wall-clock
+    # start for the artifact is captured once up front. strftime formats
+    # in C, unlike datetime.isoformat()'s Python-level path.
+    start_ns = time.perf_counter_ns()
+    started_iso = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime())
 
     # Simulate work
     await asyncio.sleep(duration)
 
-    # Create a test file
+    # Create a test file. write_bytes skips the TextIOWrapper/codec layer
+    # (content is ASCII); the test-artifacts dir is pre-created at
+    # acquisition time.
     test_file = worktree_path / "test-artifacts" / f"parallel-task-{task_id}.txt"
-    test_file.parent.mkdir(parents=True, exist_ok=True)
-    test_file.write_text(
-        f"Task ID: {task_id}\n"
-        f"Duration: {duration}s\n"
-        f"Started: {datetime.fromtimestamp(start).isoformat()}\n"
-        f"Ended: {datetime.now().isoformat()}\n"
+    test_file.write_bytes(
+        (
+            f"Task ID: {task_id}\n"
+            f"Duration: {duration}s\n"
+            f"Started: {started_iso}\n"
+            f"Ended: {time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime())}\n"
+        ).encode("ascii")
     )
 
-    # Commit
-    subprocess.run(
-        ["git", "add", "."],
-        cwd=worktree_path,
-        capture_output=True,
-        check=True,
-    )
+    # Commit asynchronously so concurrent tasks overlap on subprocess I/O
+    # instead of blocking the loop. The artifact is untracked, so it has
+    # to be staged before the commit (commit -a alone would miss it).
+    await _git("add", "-A", "--", str(test_file.relative_to(worktree_path)),
+               cwd=worktree_path, cpu=cpu)
+    await _git("commit", "-m", f"Parallel task {task_id}", cwd=worktree_path, cpu=cpu)
 
-    subprocess.run(
-        ["git", "commit", "-m", f"Parallel task {task_id}"],
-        cwd=worktree_path,
-        capture_output=True,
-        check=True,
-    )
-
-    elapsed = time.time() - start
+    elapsed = (time.perf_counter_ns() - start_ns) / 1e9
     return task_id, elapsed
 
 
-async def run_parallel_test(num_tasks: int, task_duration: float = 3.0):
-    """Run tasks in parallel and measure timing."""
+async def run_parallel_test(
+    num_tasks: int,
+    task_duration: float = 3.0,
+    pool: WorktreePool = None,
+):
+    """Run tasks in parallel and measure timing.
+
+    When a pool is passed in it is reused across tests (initialization
+    and cleanup are the caller's responsibility); otherwise a dedicated
+    pool is created and torn down here.
+    """
     print(f"\n{'=' * 80}")
     print(f"Test: {num_tasks} tasks in parallel (each ~{task_duration}s)")
     print(f"{'=' * 80}")
 
-    # Create worktree pool
-    pool = WorktreePool(pool_size=num_tasks, base_dir="../PipelineHardening-worktrees")
+    owns_pool = pool is None
+    if owns_pool:
+        pool = WorktreePool(pool_size=num_tasks, base_dir="../PipelineHardening-worktrees")
 
     try:
         # Initialize
-        print(f"Creating {num_tasks} worktrees...")
-        await pool.initialize()
-        print(f"✓ Created {num_tasks} worktrees")
-
-        # Acquire worktrees
-        worktrees = []
-        for i in range(1, num_tasks + 1):
-            wt_id = f"wt-{i}"
-            if await pool.acquire(wt_id):
-                worktrees.append((wt_id, pool.worktrees[wt_id]))
-            else:
-                print(f"✗ Failed to acquire worktree {wt_id}")
-                return False
+        if owns_pool:
+            print(f"Creating {num_tasks} worktrees...")
+            await pool.initialize()
+            print(f"✓ Created {num_tasks} worktrees")
+
+        # Acquire worktrees concurrently; acquire returns the WorktreeInfo
+        # that was actually granted, so use it directly (a failure raises
+        # and is handled by the outer except)
+        infos = await asyncio.gather(
+            *(pool.acquire(f"task-{i}") for i in range(1, num_tasks + 1))
+        )
+        worktrees = [(info.id, info) for info in infos]
+
+        # Pre-create artifact dirs once so the timed tasks skip the mkdir
+        for _, wt in worktrees:
+            os.makedirs(wt.path / "test-artifacts", exist_ok=True)
 
         print(f"✓ Acquired {len(worktrees)} worktrees")
 
         # Run tasks in parallel
         print(f"\nExecuting {num_tasks} tasks in parallel...")
-        overall_start = time.time()
-
-        tasks = [
-            simulate_task(wt.path, f"task-{i}", task_duration)
-            for i, (wt_id, wt) in enumerate(worktrees, 1)
-        ]
-
-        results = await asyncio.gather(*tasks)
-
-        overall_end = time.time()
-        total_duration = overall_end - overall_start
+        overall_start_ns = time.perf_counter_ns()
+
+        # Pin each task's git children to a distinct CPU on wider fan-outs
+        # so they stop bouncing cache lines between cores; below that the
+        # taskset wrapper costs more than it saves.
+        pin = num_tasks > 4 and hasattr(os, "sched_getaffinity")
+        cpus = sorted(os.sched_getaffinity(0)) if pin else []
+
+        # TaskGroup gives structured cancellation: one failing commit
+        # cancels the sibling tasks eagerly instead of leaving them
+        # running behind a propagating gather.
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(simulate_task(
+                    wt.path,
+                    f"task-{i}",
+                    task_duration,
+                    cpu=cpus[(i - 1) % len(cpus)] if pin else None,
+                ))
+                for i, (wt_id, wt) in enumerate(worktrees, 1)
+            ]
+
+        results = [t.result() for t in tasks]
+
+        total_duration = (time.perf_counter_ns() - overall_start_ns) / 1e9
 
         # Analyze results
         print(f"\n{'=' * 80}")
@@ -124,18 +186,14 @@ async def run_parallel_test(num_tasks: int, task_duration: float = 3.0):
         print("GIT INTEGRITY CHECK")
         print(f"{'=' * 80}")
 
-        result = subprocess.run(
-            ["git", "fsck", "--no-progress"],
-            capture_output=True,
-            text=True,
-        )
+        fsck_rc, _, fsck_err = await _git("fsck", "--no-progress", check=False)
 
-        if result.returncode == 0:
+        if fsck_rc == 0:
             print("✓ Git repository integrity verified - no corruption")
             git_ok = True
         else:
             print(f"✗ Git integrity check failed:")
-            print(f"  {result.stderr}")
+            print(f"  {fsck_err}")
             git_ok = False
 
         # Verify all files were created
@@ -144,8 +202,9 @@ async def run_parallel_test(num_tasks: int, task_duration: float = 3.0):
         print(f"{'=' * 80}")
 
         all_files_exist = True
-        for wt_id, wt in worktrees:
-            task_num = wt_id.split("-")[1]
+        # Task numbering follows list position, which is the submission
+        # order (pool grant order need not match worktree ids)
+        for task_num, (wt_id, wt) in enumerate(worktrees, 1):
             test_file = wt.path / "test-artifacts" / f"parallel-task-task-{task_num}.txt"
             if test_file.exists():
                 print(f"✓ {test_file.name} created in {wt_id}")
@@ -153,13 +212,19 @@ async def run_parallel_test(num_tasks: int, task_duration: float = 3.0):
                 print(f"✗ {test_file.name} NOT found in {wt_id}")
                 all_files_exist = False
 
-        # Cleanup
+        # Cleanup (shared pools just get their worktrees back; teardown
+        # is the caller's job)
         print(f"\n{'=' * 80}")
         print("CLEANUP")
         print(f"{'=' * 80}")
 
-        await pool.cleanup()
-        print(f"✓ Cleaned up {num_tasks} worktrees")
+        if owns_pool:
+            await pool.cleanup()
+            print(f"✓ Cleaned up {num_tasks} worktrees")
+        else:
+            for _, wt in worktrees:
+                await pool.release(wt)
+            print(f"✓ Released {len(worktrees)} worktrees back to the pool")
 
         # Return overall success
         success = parallel_ok and git_ok and all_files_exist
@@ -172,13 +237,13 @@ async def run_parallel_test(num_tasks: int, task_duration: float = 3.0):
 
     except Exception as e:
         print(f"\n✗ Test failed with exception: {e}")
-        import traceback
         traceback.print_exc()
 
-        try:
-            await pool.cleanup()
-        except:
-            pass
+        if owns_pool:
+            try:
+                await pool.cleanup()
+            except:
+                pass
 
         return False
 
@@ -191,21 +256,40 @@ async def main():
     print("Goal: Verify tasks execute in parallel, not sequentially")
     print()
 
+    # Eager tasks (3.12+) run each gathered coroutine synchronously up to
+    # its first suspension, skipping a scheduler round trip per task.
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+    # SIMULATE_WORK_SCALE shrinks (or stretches) the simulated task
+    # durations; the parallel-speedup expectations scale with them since
+    # both sides use the same numbers. Default keeps the original pacing.
+    scale = float(os.environ.get("SIMULATE_WORK_SCALE", "1.0"))
     tests = [
-        ("2 tasks in parallel", 2, 3.0),
-        ("3 tasks in parallel", 3, 3.0),
-        ("4 tasks in parallel", 4, 2.0),
+        ("2 tasks in parallel", 2, 3.0 * scale),
+        ("3 tasks in parallel", 3, 3.0 * scale),
+        ("4 tasks in parallel", 4, 2.0 * scale),
     ]
 
-    results = []
+    # One shared pool sized for the largest test: worktree creation (git
+    # checkouts) dominates these short runs, so pay it once and have each
+    # test acquire/release its subset.
+    pool = WorktreePool(
+        pool_size=max(num_tasks for _, num_tasks, _ in tests),
+        base_dir="../PipelineHardening-worktrees",
+    )
+    print("Initializing shared worktree pool...")
+    await pool.initialize()
 
-    for test_name, num_tasks, task_duration in tests:
-        success = await run_parallel_test(num_tasks, task_duration)
-        results.append((test_name, success))
+    results = []
 
-        # Delay between tests
-        if num_tasks < len(tests):
-            await asyncio.sleep(2)
+    try:
+        for test_name, num_tasks, task_duration in tests:
+            success = await run_parallel_test(num_tasks, task_duration, pool=pool)
+            results.append((test_name, success))
+    finally:
+        print("\nCleaning up shared worktree pool...")
+        await pool.cleanup()
 
     # Summary
     print(f"\n{'=' * 80}")
@@ -226,25 +310,17 @@ async def main():
     print("FINAL GIT STATUS")
     print(f"{'=' * 80}")
 
-    result = subprocess.run(
-        ["git", "status", "--porcelain"],
-        capture_output=True,
-        text=True,
-    )
+    _, status_out, _ = await _git("status", "--porcelain", check=False, capture=True)
 
-    status = result.stdout.strip()
+    status = status_out.strip()
     if not status:
         print("✓ Git repository is clean")
     else:
         print("! Git repository has changes (test artifacts)")
 
-    result = subprocess.run(
-        ["git", "worktree", "list"],
-        capture_output=True,
-        text=True,
-    )
+    _, wt_out, _ = await _git("worktree", "list", check=False, capture=True)
 
-    worktrees = [line for line in result.stdout.split("\n") if "PipelineHardening-worktrees" in line]
+    worktrees = [line for line in wt_out.split("\n") if "PipelineHardening-worktrees" in line]
     if worktrees:
         print(f"! Warning: {len(worktrees)} worktrees still exist")
     else:
@@ -254,5 +330,13 @@ async def main():
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    # uvloop's libuv-backed loop is markedly faster for the subprocess and
+    # sleep-heavy work these suites do; fall back to the stock loop where
+    # it isn't available (e.g. Windows).
+    try:
+        import uvloop
+    except ImportError:
+        exit_code = asyncio.run(main())
+    else:
+        exit_code = uvloop.run(main())
     sys.exit(exit_code)
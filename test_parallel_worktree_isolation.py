@@ -2,6 +2,7 @@
 """Test script to verify worktree isolation prevents git corruption."""
 
 import asyncio
+import hashlib
 import sys
 import logging
 from pathlib import Path
@@ -22,6 +23,25 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Main-repo metadata the parallel run must never touch. Hashing these
+# before and after is an O(refs) corruption check instead of forking
+# git for a status/fsck pass over the whole repo.
+_PROTECTED_GIT_PATHS = (
+    Path(".git/HEAD"),
+    Path(".git/index"),
+    Path(".git/refs/heads/main"),
+)
+
+
+def _git_meta_snapshot() -> dict:
+    """Hash HEAD, the index, and every loose ref of the main repo."""
+    paths = [Path(".git/HEAD"), Path(".git/index"), *Path(".git/refs").rglob("*")]
+    return {
+        p: hashlib.blake2b(p.read_bytes()).digest()
+        for p in paths
+        if p.is_file()
+    }
+
 
 async def main():
     """Run parallel test orchestrator with 2 workers."""
@@ -29,13 +49,16 @@ async def main():
     logger.info("Starting Worktree Isolation Test")
     logger.info("=" * 80)
 
+    # Snapshot main-repo metadata before any worktree activity
+    baseline = _git_meta_snapshot()
+
     # Configure the orchestrator with 2 workers
     config = ParallelTestConfig(
         num_workers=2,
         worktree_base_dir="../PipelineHardening-worktrees",
         max_queue_size=10,
         max_retries_per_test=1,
-        worker_timeout_minutes=10,
+        worker_task_timeout_seconds=600.0,
         cleanup_on_completion=True,
         preserve_failed_worktrees=True,
     )
@@ -83,10 +106,22 @@ async def main():
         await orchestrator.initialize()
         await orchestrator.start()
 
-        # Submit both tests - they will run in parallel
-        await orchestrator.submit_batch(test_requests)
-
-        # Wait for completion
+        # Submit both tests - they will run in parallel. submit_batch
+        # hands back one completion future per request; consuming them
+        # with as_completed logs each test the moment it finishes (its
+        # worker has already released the worktree by then) instead of
+        # sitting silent until the slower plan is done.
+        futures = await orchestrator.submit_batch(test_requests)
+
+        for next_done in asyncio.as_completed(futures):
+            result = await next_done
+            logger.info(
+                f"Finished: {result.test_request_id} -> {result.status} "
+                f"(worktree {result.worktree_id} freed)"
+            )
+
+        # All futures resolved, so this returns immediately with the
+        # aggregate report.
         report = await orchestrator.wait_for_completion()
 
         # Cleanup if configured
@@ -128,24 +163,23 @@ async def main():
 
         logger.info("=" * 80)
 
-        # Check git status to verify no corruption
+        # Compare main-repo metadata against the pre-run snapshot instead
+        # of forking git: HEAD, the index and refs/heads/main must hash
+        # identically if the workers stayed inside their worktrees.
         logger.info("")
-        logger.info("Checking git status for corruption...")
-        import subprocess
-
-        result = subprocess.run(
-            ["git", "status", "--porcelain"],
-            capture_output=True,
-            text=True,
-        )
-
-        if result.returncode == 0:
-            logger.info("✓ Git repository is clean (no corruption detected)")
-            if result.stdout.strip():
-                logger.info(f"  Modified files:\n{result.stdout}")
+        logger.info("Checking main repo metadata for corruption...")
+        current = _git_meta_snapshot()
+        changed = [
+            str(p)
+            for p in _PROTECTED_GIT_PATHS
+            if baseline.get(p) != current.get(p)
+        ]
+
+        if not changed:
+            logger.info("✓ Main repo metadata unchanged (no corruption detected)")
         else:
-            logger.error("✗ Git status command failed!")
-            logger.error(f"  Error: {result.stderr}")
+            logger.error("✗ Main repo metadata changed!")
+            logger.error(f"  Changed: {', '.join(changed)}")
             return 1
 
         # Return exit code based on test results
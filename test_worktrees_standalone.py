@@ -1,11 +1,45 @@
-"""Standalone test for git worktree creation - no dependencies."""
+"""Standalone test for git worktree creation - no required dependencies."""
 
+import asyncio
+import os
 import subprocess
 import shutil
 from pathlib import Path
 
+# Optional: libgit2 bindings keep every operation in-process instead of
+# paying a fork+exec per git call (~12 per run here). Subprocess git is
+# the fallback, so the test stays dependency-free.
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
 
-def test_worktree_basic():
+
+def _chmod_retry(func, path, exc_info):
+    """rmtree onerror hook: make the path writable and retry once."""
+    os.chmod(path, 0o700)
+    func(path)
+
+
+def _delete_branch(repo, main_repo: Path, branch_name: str) -> None:
+    """Delete a branch if it exists (in-process when libgit2 is available)."""
+    if repo is not None:
+        try:
+            repo.branches.local.delete(branch_name)
+        except (KeyError, pygit2.GitError):
+            pass
+        return
+
+    # Best-effort: the branch may not exist and nothing reads the output
+    subprocess.run(
+        ["git", "branch", "-D", branch_name],
+        cwd=str(main_repo),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+async def test_worktree_basic():
     """Test basic git worktree operations."""
     print("\n" + "="*60)
     print("Testing Git Worktree Creation")
@@ -14,8 +48,10 @@ def test_worktree_basic():
     base_dir = Path("../PipelineHardening-worktrees").absolute()
     main_repo = Path.cwd()
 
+    repo = pygit2.Repository(str(main_repo)) if pygit2 is not None else None
     print(f"Main repo: {main_repo}")
-    print(f"Worktrees dir: {base_dir}\n")
+    print(f"Worktrees dir: {base_dir}")
+    print(f"Git backend: {'libgit2 (in-process)' if repo is not None else 'subprocess'}\n")
 
     # Create base directory
     print("1. Creating base directory...")
@@ -24,75 +60,116 @@ def test_worktree_basic():
 
     worktrees_created = []
 
-    try:
-        # Create 3 worktrees
-        for i in range(1, 4):
-            wt_id = f"wt-{i}"
-            wt_path = base_dir / wt_id
-            branch_name = f"worktree-{wt_id}"
-
-            print(f"2.{i} Creating worktree: {wt_id}")
-
-            # Delete branch if exists
-            subprocess.run(
-                ["git", "branch", "-D", branch_name],
+    async def _create_wt(i: int):
+        """Create one worktree; returns (id, path, branch) or None."""
+        wt_id = f"wt-{i}"
+        wt_path = base_dir / wt_id
+        branch_name = f"worktree-{wt_id}"
+
+        print(f"2.{i} Creating worktree: {wt_id}")
+
+        # Create worktree; a leftover branch from a previous run is
+        # force-reset as part of creation rather than probed and deleted
+        # up front (saves one git invocation per worktree).
+        if repo is not None:
+            # In-process; calls from gathered coroutines never overlap
+            # on the single-threaded loop, so the shared repo is safe
+            try:
+                branch = repo.branches.local.create(
+                    branch_name, repo.revparse_single("main"), force=True
+                )
+                repo.add_worktree(wt_id, str(wt_path), branch)
+            except pygit2.GitError as e:
+                print(f"     ✗ Failed: {e}")
+                return None
+        else:
+            # Parallel creations overlap the checkout I/O; git serializes
+            # the ref-update stage internally via its own repo lock
+            proc = await asyncio.create_subprocess_exec(
+                "git", "worktree", "add", "--force", "-B", branch_name,
+                str(wt_path), "main",
                 cwd=str(main_repo),
-                capture_output=True,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
             )
+            _, stderr = await proc.communicate()
+            if proc.returncode != 0:
+                print(f"     ✗ Failed: {stderr.decode()}")
+                return None
 
-            # Create worktree
-            result = subprocess.run(
-                ["git", "worktree", "add", str(wt_path), "-b", branch_name, "main"],
-                cwd=str(main_repo),
-                capture_output=True,
-                text=True,
-            )
+        print(f"     ✓ Created {wt_id} at {wt_path}")
+        return wt_id, wt_path, branch_name
 
-            if result.returncode == 0:
-                print(f"     ✓ Created {wt_id} at {wt_path}")
-                worktrees_created.append((wt_id, wt_path, branch_name))
-            else:
-                print(f"     ✗ Failed: {result.stderr}")
-                break
+    try:
+        # Create 3 worktrees concurrently
+        created = await asyncio.gather(*(_create_wt(i) for i in range(1, 4)))
+        worktrees_created.extend(c for c in created if c is not None)
 
         print()
 
         # List worktrees
         print("3. Listing all worktrees:")
-        result = subprocess.run(
-            ["git", "worktree", "list"],
-            cwd=str(main_repo),
-            capture_output=True,
-            text=True,
-        )
-        for line in result.stdout.strip().split("\n"):
-            print(f"   {line}")
+        if repo is not None:
+            print(f"   {main_repo} (main)")
+            for name in repo.list_worktrees():
+                print(f"   {repo.lookup_worktree(name).path}")
+        else:
+            result = subprocess.run(
+                ["git", "worktree", "list"],
+                cwd=str(main_repo),
+                capture_output=True,
+                text=True,
+            )
+            for line in result.stdout.strip().split("\n"):
+                print(f"   {line}")
 
         print("\n✓ Worktree creation successful!\n")
 
     finally:
         # Cleanup
         print("4. Cleaning up...")
-        for wt_id, wt_path, branch_name in worktrees_created:
-            # Remove worktree
-            subprocess.run(
-                ["git", "worktree", "remove", str(wt_path), "--force"],
-                cwd=str(main_repo),
-                capture_output=True,
-            )
-
-            # Delete directory if still exists
-            if wt_path.exists():
-                shutil.rmtree(wt_path, ignore_errors=True)
-
-            # Delete branch
-            subprocess.run(
-                ["git", "branch", "-D", branch_name],
-                cwd=str(main_repo),
-                capture_output=True,
-            )
-
-            print(f"   ✓ Removed {wt_id}")
+        if worktrees_created:
+            # Directory removal dominates cleanup and is unlink-bound and
+            # independent per worktree, so fan it out over threads; the
+            # onerror hook chmods read-only files writable and retries
+            # instead of aborting the tree walk.
+            await asyncio.gather(*(
+                asyncio.to_thread(shutil.rmtree, wt_path, onerror=_chmod_retry)
+                for _, wt_path, _ in worktrees_created
+                if wt_path.exists()
+            ))
+
+            # Registration and branch cleanup afterwards, batched.
+            if repo is not None:
+                # libgit2 objects are not thread-safe, and these calls
+                # are in-process and cheap — keep them serial
+                for wt_id, _, branch_name in worktrees_created:
+                    try:
+                        repo.lookup_worktree(wt_id).prune(True)
+                    except (KeyError, pygit2.GitError):
+                        pass
+                    _delete_branch(repo, main_repo, branch_name)
+            else:
+                # One prune covers every removed worktree and one
+                # branch -D takes all branches: 2 forks total instead of
+                # 3 per worktree. Output is never read (best-effort
+                # cleanup), so discard it instead of capturing/decoding.
+                subprocess.run(
+                    ["git", "worktree", "prune"],
+                    cwd=str(main_repo),
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+                subprocess.run(
+                    ["git", "branch", "-D",
+                     *(branch for _, _, branch in worktrees_created)],
+                    cwd=str(main_repo),
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+
+            for wt_id, _, _ in worktrees_created:
+                print(f"   ✓ Removed {wt_id}")
 
         # Remove base directory if empty
         if base_dir.exists() and not list(base_dir.iterdir()):
@@ -103,4 +180,4 @@ def test_worktree_basic():
 
 
 if __name__ == "__main__":
-    test_worktree_basic()
+    asyncio.run(test_worktree_basic())
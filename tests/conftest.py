@@ -1,13 +1,16 @@
 """Pytest configuration and fixtures for E2E testing."""
 
+import asyncio
 import os
 import pytest
-import asyncio
 from pathlib import Path
+
 from typing import AsyncGenerator
 
 import httpx
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
 
 # Add backend to path
 import sys
@@ -16,22 +19,62 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
 from app.database import Base
 
 
-# Test database
-TEST_DATABASE_URL = "sqlite+aiosqlite:///./test_pipeline.db"
-
-
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create event loop for async tests."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def event_loop_policy():
+    """Build every test loop on uvloop when available.
+
+    pytest-asyncio (>=0.23) constructs loops through this fixture, so
+    the whole suite — subprocess- and HTTP-heavy, exactly where uvloop's
+    C-level dispatch pays off — runs libuv-backed without mutating the
+    process-global policy. Falls back to the stock loop where uvloop
+    isn't available (e.g. Windows).
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(autouse=True, scope="session")
+async def _eager_task_factory():
+    """Run tasks eagerly on the session loop (3.12+).
+
+    Eager tasks execute each coroutine synchronously up to its first
+    suspension, so the many short coroutines the queue and workers spawn
+    (mark_running, enqueue puts) skip a scheduler round trip apiece.
+    No-op on older Pythons.
+    """
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+
+# Shared-cache in-memory database: no file I/O at all, and the shared
+# cache keeps every StaticPool checkout pointed at the same database for
+# the whole session (a plain :memory: URL would hand each connection its
+# own empty DB).
+TEST_DATABASE_URL = "sqlite+aiosqlite:///file::memory:?cache=shared&uri=true"
 
 
 @pytest.fixture(scope="session")
 async def test_engine():
     """Create test database engine."""
-    engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+    engine = create_async_engine(
+        TEST_DATABASE_URL,
+        echo=False,
+        poolclass=StaticPool,
+        connect_args={"uri": True, "check_same_thread": False},
+    )
+
+    # Durability pragmas are pointless for an in-memory DB that dies with
+    # the process; this overrides the WAL/NORMAL defaults app.database
+    # installs on every Engine connect.
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_test_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.close()
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -44,50 +87,119 @@ async def test_engine():
 
     await engine.dispose()
 
-    # Remove test database file
-    db_path = Path("./test_pipeline.db")
-    if db_path.exists():
-        db_path.unlink()
-
 
 @pytest.fixture
 async def db_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
-    """Create database session for tests."""
-    async_session = async_sessionmaker(
-        test_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
+    """Create database session for tests.
 
-    async with async_session() as session:
-        yield session
-        await session.rollback()
+    Each test runs inside an outer connection-level transaction that is
+    rolled back at teardown, so tests can commit freely without leaking
+    rows into each other. Session-level commits are redirected onto a
+    SAVEPOINT, and the listener below reopens it whenever the test (or
+    code under test) releases it.
+    """
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
+        session = AsyncSession(bind=conn, expire_on_commit=False)
 
+        await conn.begin_nested()
 
-@pytest.fixture
+        @event.listens_for(session.sync_session, "after_transaction_end")
+        def _restart_savepoint(sync_session, transaction):
+            if transaction.nested and not transaction._parent.nested:
+                sync_session.begin_nested()
+
+        try:
+            yield session
+        finally:
+            event.remove(session.sync_session, "after_transaction_end", _restart_savepoint)
+            await session.close()
+            await trans.rollback()
+
+
+class _NoopDB:
+    """Inert stand-in for a sync Session: every call is a cheap no-op.
+
+    Mock() lazily builds a child Mock per attribute access, which adds
+    up on the worker's per-test commit/close calls; a slotted plain
+    class costs one bound-method lookup instead.
+    """
+
+    __slots__ = ()
+
+    def add(self, obj):
+        pass
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def mock_db(monkeypatch):
+    """Replace the sync DB session factory with a no-op stub for every test.
+
+    The worker tests used to wrap each body in
+    ``patch('backend.app.database.sync_session')``; monkeypatch swaps
+    the attribute once per test for a fraction of the context-manager
+    setup cost, and nothing in this suite wants a real sync session.
+    """
+    db = _NoopDB()
+    monkeypatch.setattr("backend.app.database.sync_session", lambda: db)
+    return db
+
+
+@pytest.fixture(scope="session")
 def project_root() -> Path:
     """Get project root path."""
     return Path(__file__).parent.parent
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_plan_path(project_root: Path) -> str:
     """Get path to test plan."""
     return str(project_root / "docs" / "plans" / "test-plan-01.md")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def parsed_plan(test_plan_path: str):
+    """Parse the test plan once for the whole session.
+
+    Parsing is a pure function of the plan file, so the read-only parser
+    tests share one result instead of re-reading and re-walking the
+    markdown per test.
+    """
+    from app.services.plan_parser import PlanParser
+
+    return PlanParser(test_plan_path).parse()
+
+
+@pytest.fixture(scope="session")
 def test_artifacts_dir(project_root: Path) -> Path:
-    """Get test artifacts directory."""
+    """Get test artifacts directory (created once per session)."""
     artifacts_dir = project_root / "test-artifacts"
     artifacts_dir.mkdir(exist_ok=True)
     return artifacts_dir
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def api_client() -> AsyncGenerator[httpx.AsyncClient, None]:
-    """Create async HTTP client for API testing."""
-    async with httpx.AsyncClient(base_url="http://localhost:8001") as client:
+    """Create async HTTP client for API testing.
+
+    Session-scoped: one client means one connection pool for the whole
+    run, so tests reuse kept-alive sockets instead of paying connection
+    setup and teardown per test. Tests must not mutate client state
+    (headers, cookies) since they share the instance.
+    """
+    limits = httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60.0)
+    async with httpx.AsyncClient(
+        base_url="http://localhost:8001", limits=limits
+    ) as client:
         yield client
 
 
@@ -12,10 +12,8 @@ import pytest
 import asyncio
 from pathlib import Path
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
-
-from app.services.plan_parser import PlanParser
+# backend is put on sys.path once by tests/conftest.py (which pytest
+# imports before any test module), so no per-module insert here.
 from app.services.task_executor import TaskExecutor, ExecutionResult
 from app.services.batch_orchestrator import BatchOrchestrator
 from app.models.autonomous import SessionStatus, BatchStatus, TaskStatus
@@ -24,29 +22,26 @@ from app.models.autonomous import SessionStatus, BatchStatus, TaskStatus
 class TestPlanParser:
     """Tests for plan parser."""
 
-    def test_parse_test_plan(self, test_plan_path: str):
+    def test_parse_test_plan(self, parsed_plan):
         """Test parsing the test plan."""
-        parser = PlanParser(test_plan_path)
-        batches = parser.parse()
+        batches = parsed_plan
 
         assert len(batches) >= 1
         assert batches[0].number == 1
         assert len(batches[0].tasks) >= 1
 
-    def test_parse_tasks(self, test_plan_path: str):
+    def test_parse_tasks(self, parsed_plan):
         """Test task extraction."""
-        parser = PlanParser(test_plan_path)
-        batches = parser.parse()
+        batches = parsed_plan
 
         task = batches[0].tasks[0]
         assert task.number == "1.1"
         assert "hello" in task.title.lower() or "file" in task.title.lower()
         assert len(task.files) >= 1
 
-    def test_parse_batch_dependencies(self, test_plan_path: str):
+    def test_parse_batch_dependencies(self, parsed_plan):
         """Test batch dependency parsing."""
-        parser = PlanParser(test_plan_path)
-        batches = parser.parse()
+        batches = parsed_plan
 
         # Batch 1 should have no dependencies
         assert batches[0].dependencies == []
@@ -176,8 +171,12 @@ class TestE2EIntegration:
         data = response.json()
         execution_id = data["execution_id"]
 
-        # Poll for completion
-        for _ in range(60):  # 60 second timeout
+        # Poll for completion with exponential backoff: short sleeps catch
+        # fast runs almost immediately, the 1s cap bounds request volume on
+        # long ones, and the deadline keeps the original 60s budget.
+        deadline = asyncio.get_running_loop().time() + 60
+        attempt = 0
+        while True:
             status_response = await api_client.get(
                 f"/api/v1/autonomous/{execution_id}/status"
             )
@@ -185,8 +184,11 @@ class TestE2EIntegration:
 
             if status["status"] in ["complete", "failed"]:
                 break
+            if asyncio.get_running_loop().time() >= deadline:
+                break
 
-            await asyncio.sleep(1)
+            await asyncio.sleep(min(0.05 * 2 ** attempt, 1.0))
+            attempt += 1
 
         assert status["status"] == "complete"
 
@@ -2,6 +2,7 @@
 
 import pytest
 import asyncio
+from collections import deque
 from pathlib import Path
 
 from backend.app.services.parallel_orchestrator import (
@@ -9,7 +10,62 @@ from backend.app.services.parallel_orchestrator import (
     ParallelTestConfig,
     ParallelTestReport,
 )
+from backend.app.services.execution_worker import ExecutionWorker
 from backend.app.services.test_queue import TestRequest, TestHarnessConfig
+from backend.app.services.worktree_pool import WorktreeInfo, WorktreeStatus
+
+NUM_WORKERS = 2
+
+
+@pytest.fixture(scope="module")
+def worktree_dirs(tmp_path_factory):
+    """Create the mock worktree directories once for the whole module.
+
+    Only the directories are shared — they are never written to — so
+    every test reuses them instead of paying mkdir per fixture.
+    """
+    base = tmp_path_factory.mktemp("worktrees")
+    dirs = []
+    for i in range(1, NUM_WORKERS + 1):
+        wt_path = base / f"wt-{i}"
+        wt_path.mkdir(parents=True, exist_ok=True)
+        dirs.append((f"wt-{i}", wt_path, f"branch-{i}"))
+    return dirs
+
+
+def populate_orchestrator(orch, worktree_dirs):
+    """Wire mock worktrees and workers into an orchestrator.
+
+    Replaces initialize() without any git operations: WorktreeInfo
+    records are fresh per call (tests mutate their status) but share the
+    module-scoped directories, and the pool's free list / semaphore /
+    counters are set up the same way initialize() would. A previous
+    test's shutdown may have cleaned a shared directory away, so missing
+    ones are re-created (a no-op syscall when they survived).
+    """
+    orch.pool._initialized = True
+    for wt_id, wt_path, branch in worktree_dirs:
+        wt_path.mkdir(parents=True, exist_ok=True)
+        orch.pool.worktrees[wt_id] = WorktreeInfo(
+            id=wt_id,
+            path=wt_path,
+            branch=branch,
+            status=WorktreeStatus.FREE,
+        )
+        orch.pool._counts[WorktreeStatus.FREE] += 1
+    orch.pool._free = deque(orch.pool.worktrees)
+    orch.pool._sem = asyncio.Semaphore(len(orch.pool.worktrees))
+
+    for i in range(1, len(worktree_dirs) + 1):
+        orch.workers.append(
+            ExecutionWorker(
+                worker_id=i,
+                queue=orch.queue,
+                pool=orch.pool,
+            )
+        )
+    orch._initialized = True
+    return orch
 
 
 class TestOrchestratorLifecycle:
@@ -19,7 +75,7 @@ class TestOrchestratorLifecycle:
     async def orchestrator(self, tmp_path):
         """Create an orchestrator with temp worktree directory."""
         config = ParallelTestConfig(
-            num_workers=2,
+            num_workers=NUM_WORKERS,
             worktree_base_dir=str(tmp_path / "worktrees"),
             max_queue_size=10,
         )
@@ -42,9 +98,8 @@ class TestOrchestratorLifecycle:
 
         # Initialize workers only
         for i in range(1, orchestrator.config.num_workers + 1):
-            from backend.app.services.execution_worker import ExecutionWorker
             worker = ExecutionWorker(
-                worker_id=f"worker-{i}",
+                worker_id=i,
                 queue=orchestrator.queue,
                 pool=orchestrator.pool,
             )
@@ -56,35 +111,9 @@ class TestOrchestratorLifecycle:
         assert len(orchestrator.workers) == 2
 
     @pytest.mark.asyncio
-    async def test_orchestrator_start_stop(self, orchestrator, tmp_path):
+    async def test_orchestrator_start_stop(self, orchestrator, worktree_dirs):
         """Test orchestrator can start and stop workers."""
-        # Skip pool initialization and manually set up
-        orchestrator.pool._initialized = True
-        from backend.app.services.worktree_pool import WorktreeInfo, WorktreeStatus
-        from backend.app.services.execution_worker import ExecutionWorker
-
-        # Add mock worktrees
-        for i in range(1, 3):
-            wt_path = tmp_path / f"wt-{i}"
-            wt_path.mkdir(parents=True, exist_ok=True)
-            worktree = WorktreeInfo(
-                id=f"wt-{i}",
-                path=wt_path,
-                branch=f"branch-{i}",
-                status=WorktreeStatus.FREE,
-            )
-            orchestrator.pool.worktrees[f"wt-{i}"] = worktree
-
-        # Add workers
-        for i in range(1, 3):
-            worker = ExecutionWorker(
-                worker_id=f"worker-{i}",
-                queue=orchestrator.queue,
-                pool=orchestrator.pool,
-            )
-            orchestrator.workers.append(worker)
-
-        orchestrator._initialized = True
+        populate_orchestrator(orchestrator, worktree_dirs)
 
         # Start
         await orchestrator.start()
@@ -101,6 +130,31 @@ class TestOrchestratorLifecycle:
         for worker in orchestrator.workers:
             assert worker.running is False
 
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(
+        not hasattr(asyncio, "eager_task_factory"),
+        reason="eager task factory requires Python 3.12+",
+    )
+    async def test_orchestrator_start_sets_eager_task_factory(self, orchestrator):
+        """Test start() installs the eager task factory on its loop."""
+        # Skip initialization to avoid git operations
+        orchestrator.pool._initialized = True
+        orchestrator._initialized = True
+
+        # The autouse session fixture installs the factory on this loop
+        # too; clear it first so the assertion exercises start() itself.
+        loop = asyncio.get_running_loop()
+        loop.set_task_factory(None)
+        try:
+            await orchestrator.start()
+
+            assert loop.get_task_factory() is asyncio.eager_task_factory
+
+            await orchestrator.shutdown()
+        finally:
+            # Leave the session loop as the fixture configured it
+            loop.set_task_factory(asyncio.eager_task_factory)
+
     @pytest.mark.asyncio
     async def test_orchestrator_submit_tests(self, orchestrator, tmp_path):
         """Test submitting tests to orchestrator."""
@@ -147,35 +201,9 @@ class TestOrchestratorLifecycle:
         assert queue_status["pending_count"] == 5
 
     @pytest.mark.asyncio
-    async def test_orchestrator_get_status(self, orchestrator, tmp_path):
+    async def test_orchestrator_get_status(self, orchestrator, worktree_dirs):
         """Test getting orchestrator status."""
-        # Skip pool init and manually set up
-        orchestrator.pool._initialized = True
-        from backend.app.services.worktree_pool import WorktreeInfo, WorktreeStatus
-        from backend.app.services.execution_worker import ExecutionWorker
-
-        # Add mock worktrees
-        for i in range(1, 3):
-            wt_path = tmp_path / f"wt-{i}"
-            wt_path.mkdir(parents=True, exist_ok=True)
-            worktree = WorktreeInfo(
-                id=f"wt-{i}",
-                path=wt_path,
-                branch=f"branch-{i}",
-                status=WorktreeStatus.FREE,
-            )
-            orchestrator.pool.worktrees[f"wt-{i}"] = worktree
-
-        # Add workers
-        for i in range(1, 3):
-            worker = ExecutionWorker(
-                worker_id=f"worker-{i}",
-                queue=orchestrator.queue,
-                pool=orchestrator.pool,
-            )
-            orchestrator.workers.append(worker)
-
-        orchestrator._initialized = True
+        populate_orchestrator(orchestrator, worktree_dirs)
         await orchestrator.start()
 
         # Get status
@@ -197,42 +225,16 @@ class TestOrchestratorExecution:
     """Test orchestrator execution flow."""
 
     @pytest.fixture
-    async def orchestrator(self, tmp_path):
+    async def orchestrator(self, tmp_path, worktree_dirs):
         """Create orchestrator with mock worktrees."""
         config = ParallelTestConfig(
-            num_workers=2,
+            num_workers=NUM_WORKERS,
             worktree_base_dir=str(tmp_path / "worktrees"),
             cleanup_on_completion=False,  # Don't cleanup for inspection
         )
-        orch = ParallelTestOrchestrator(config=config)
-
-        # Skip pool initialization to avoid git operations
-        orch.pool._initialized = True
-        from backend.app.services.worktree_pool import WorktreeInfo, WorktreeStatus
-        from backend.app.services.execution_worker import ExecutionWorker
-
-        # Add mock worktrees
-        for i in range(1, 3):
-            wt_path = tmp_path / f"wt-{i}"
-            wt_path.mkdir(parents=True, exist_ok=True)
-            worktree = WorktreeInfo(
-                id=f"wt-{i}",
-                path=wt_path,
-                branch=f"branch-{i}",
-                status=WorktreeStatus.FREE,
-            )
-            orch.pool.worktrees[f"wt-{i}"] = worktree
-
-        # Create workers
-        for i in range(1, 3):
-            worker = ExecutionWorker(
-                worker_id=f"worker-{i}",
-                queue=orch.queue,
-                pool=orch.pool,
-            )
-            orch.workers.append(worker)
-
-        orch._initialized = True
+        orch = populate_orchestrator(
+            ParallelTestOrchestrator(config=config), worktree_dirs
+        )
 
         yield orch
 
@@ -269,6 +271,33 @@ class TestOrchestratorExecution:
 
         await orchestrator.shutdown()
 
+    @pytest.mark.asyncio
+    async def test_stream_results_yields_incrementally(self, orchestrator):
+        """Test stream_results yields each result without waiting for the batch."""
+        from backend.app.services.test_queue import TestResult
+
+        requests = [
+            TestRequest(id=f"test-{i}", plan_file=f"test-{i}.md")
+            for i in range(3)
+        ]
+        futures = await orchestrator.submit_batch(requests)
+        stream = orchestrator.stream_results(futures)
+
+        # Resolve one result by hand (workers not started): the stream
+        # must yield it while the rest of the batch is still pending.
+        result = TestResult(
+            test_request_id="test-0",
+            worktree_id="wt-1",
+            status="COMPLETE",
+        )
+        await orchestrator.queue.mark_complete("test-0", result)
+
+        first = await asyncio.wait_for(anext(stream), timeout=1.0)
+        assert first.test_request_id == "test-0"
+        assert not orchestrator.queue.pending.empty()
+
+        await stream.aclose()
+
     @pytest.mark.asyncio
     async def test_orchestrator_run_tests_convenience(self, orchestrator):
         """Test run_tests convenience method."""
@@ -293,7 +322,7 @@ class TestOrchestratorExecution:
     @pytest.mark.asyncio
     async def test_orchestrator_parallel_execution(self, orchestrator):
         """Test that tests run in parallel."""
-        import time
+        from time import perf_counter_ns
 
         await orchestrator.start()
 
@@ -307,16 +336,17 @@ class TestOrchestratorExecution:
         ]
         await orchestrator.submit_batch(requests)
 
-        # Measure time to complete
-        start_time = time.time()
+        # Measure time to complete. perf_counter_ns is monotonic, so the
+        # assertion can't be skewed by NTP/wall-clock jumps on CI.
+        start_ns = perf_counter_ns()
         report = await orchestrator.wait_for_completion()
-        duration = time.time() - start_time
+        duration_ns = perf_counter_ns() - start_ns
 
         # With 2 workers and 6 tests (each taking ~0.1s):
         # Sequential: 6 * 0.1 = 0.6s
         # Parallel: 6 / 2 * 0.1 = 0.3s
         # Allow some overhead, but should be much faster than sequential
-        assert duration < 1.0  # Should complete quickly with parallel execution
+        assert duration_ns < 1_000_000_000  # < 1s with parallel execution
 
         assert report.total_tests == 6
         assert report.tests_passed == 6
@@ -324,43 +354,16 @@ class TestOrchestratorExecution:
         await orchestrator.shutdown()
 
     @pytest.mark.asyncio
-    async def test_orchestrator_context_manager(self, tmp_path):
+    async def test_orchestrator_context_manager(self, tmp_path, worktree_dirs):
         """Test orchestrator as async context manager."""
-        from backend.app.services.worktree_pool import WorktreeInfo, WorktreeStatus
-        from backend.app.services.execution_worker import ExecutionWorker
-
         config = ParallelTestConfig(
-            num_workers=2,
+            num_workers=NUM_WORKERS,
             worktree_base_dir=str(tmp_path / "worktrees"),
         )
 
-        orch = ParallelTestOrchestrator(config=config)
-
-        # Skip real initialization
-        orch.pool._initialized = True
-
-        # Add mock worktrees
-        for i in range(1, 3):
-            wt_path = tmp_path / f"wt-{i}"
-            wt_path.mkdir(parents=True, exist_ok=True)
-            worktree = WorktreeInfo(
-                id=f"wt-{i}",
-                path=wt_path,
-                branch=f"branch-{i}",
-                status=WorktreeStatus.FREE,
-            )
-            orch.pool.worktrees[f"wt-{i}"] = worktree
-
-        # Add workers
-        for i in range(1, 3):
-            worker = ExecutionWorker(
-                worker_id=f"worker-{i}",
-                queue=orch.queue,
-                pool=orch.pool,
-            )
-            orch.workers.append(worker)
-
-        orch._initialized = True
+        orch = populate_orchestrator(
+            ParallelTestOrchestrator(config=config), worktree_dirs
+        )
 
         # Use manually initialized orch
         await orch.start()
@@ -388,41 +391,15 @@ class TestOrchestratorReporting:
     """Test orchestrator reporting functionality."""
 
     @pytest.fixture
-    async def orchestrator(self, tmp_path):
+    async def orchestrator(self, tmp_path, worktree_dirs):
         """Create orchestrator with mock worktrees."""
         config = ParallelTestConfig(
-            num_workers=2,
+            num_workers=NUM_WORKERS,
             worktree_base_dir=str(tmp_path / "worktrees"),
         )
-        orch = ParallelTestOrchestrator(config=config)
-
-        # Skip pool init and manually set up
-        orch.pool._initialized = True
-        from backend.app.services.worktree_pool import WorktreeInfo, WorktreeStatus
-        from backend.app.services.execution_worker import ExecutionWorker
-
-        # Add mock worktrees
-        for i in range(1, 3):
-            wt_path = tmp_path / f"wt-{i}"
-            wt_path.mkdir(parents=True, exist_ok=True)
-            worktree = WorktreeInfo(
-                id=f"wt-{i}",
-                path=wt_path,
-                branch=f"branch-{i}",
-                status=WorktreeStatus.FREE,
-            )
-            orch.pool.worktrees[f"wt-{i}"] = worktree
-
-        # Create workers
-        for i in range(1, 3):
-            worker = ExecutionWorker(
-                worker_id=f"worker-{i}",
-                queue=orch.queue,
-                pool=orch.pool,
-            )
-            orch.workers.append(worker)
-
-        orch._initialized = True
+        orch = populate_orchestrator(
+            ParallelTestOrchestrator(config=config), worktree_dirs
+        )
 
         yield orch
 
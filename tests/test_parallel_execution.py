@@ -1,12 +1,16 @@
 """Tests for parallel execution system (Queue, Workers, Pool)."""
 
+import os
+
 import pytest
 import asyncio
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 from backend.app.services.test_queue import (
+    FastAsyncDeque,
     TestQueue,
     TestRequest,
     TestResult,
@@ -17,6 +21,120 @@ from backend.app.services.worktree_pool import WorktreePool, WorktreeInfo, Workt
 from backend.app.services.execution_worker import ExecutionWorker
 
 
+@pytest.fixture(scope="module")
+def mock_worktree_dirs(tmp_path_factory):
+    """Create mock worktree directories once for the whole module.
+
+    The pool/worker simulation only needs WorktreeInfo.path to point at
+    a real directory — tests never write inside them — so one batch of
+    mkdirs serves every fixture instead of two syscalls per worktree per
+    test.
+    """
+    base = tmp_path_factory.mktemp("mock-worktrees")
+    dirs = []
+    for i in range(1, 4):
+        wt_path = base / f"wt-{i}"
+        wt_path.mkdir()
+        dirs.append(wt_path)
+    return dirs
+
+
+@pytest.fixture(scope="module")
+def wt_skeleton(tmp_path_factory):
+    """Reusable worktree skeleton (directory with a fake .git/ inside).
+
+    Tests that need a git-shaped worktree symlink to this instead of
+    re-running the mkdir pair; symlink traversal is transparent to Path
+    operations, so WorktreeInfo.path semantics are unchanged.
+    """
+    skeleton = tmp_path_factory.mktemp("wt-skeleton") / "skeleton"
+    skeleton.mkdir()
+    (skeleton / ".git").mkdir()
+    return skeleton
+
+
+def make_mock_pool(dirs, size):
+    """Build an initialized pool over premade directories (no git ops).
+
+    Also restores the free list, semaphore, and status counters that
+    initialize() normally builds, so acquire()/release() behave exactly
+    as in production.
+    """
+    pool = WorktreePool(pool_size=size)
+    pool._initialized = True
+    for i, wt_path in enumerate(dirs[:size], start=1):
+        pool.worktrees[f"wt-{i}"] = WorktreeInfo(
+            id=f"wt-{i}",
+            path=wt_path,
+            branch=f"branch-{i}",
+            status=WorktreeStatus.FREE,
+        )
+        pool._counts[WorktreeStatus.FREE] += 1
+    pool._free = deque(pool.worktrees)
+    pool._sem = asyncio.Semaphore(len(pool.worktrees))
+    return pool
+
+
+def mock_run_tasks(test_request, worktree, started_at):
+    """Stand-in for ExecutionWorker._run_tasks_in_worktree: instant pass."""
+    return TestResult.make_complete(
+        test_request.id, worktree.id, tasks_passed=1
+    )
+
+
+async def build_exec_stack(dirs, pool_size, num_tasks, id_prefix="test"):
+    """Queue + mock pool + one worker per worktree, with tasks enqueued.
+
+    The worker/integration/hardening load tests only vary in pool size
+    and task count; building the stack here keeps each test down to its
+    assertions.
+    """
+    queue = TestQueue(max_size=0)
+    pool = make_mock_pool(dirs, pool_size)
+    workers = [
+        ExecutionWorker(i, queue, pool)
+        for i in range(1, pool_size + 1)
+    ]
+    await queue.enqueue_batch([
+        TestRequest(id=f"{id_prefix}-{i}", plan_file=f"{id_prefix}-{i}.md")
+        for i in range(num_tasks)
+    ])
+    return queue, pool, workers
+
+
+async def run_workers_until_empty(queue, workers, timeout, fail_msg):
+    """Start workers concurrently, drain the queue, stop them again.
+
+    TaskGroup fans the start/stop calls out in one suspension apiece,
+    mirroring how the orchestrator starts its workers in production.
+    """
+    async with asyncio.TaskGroup() as tg:
+        for worker in workers:
+            tg.create_task(worker.start())
+    try:
+        async with asyncio.timeout(timeout):
+            await queue.wait_until_empty()
+    except TimeoutError:
+        pytest.fail(fail_msg)
+    async with asyncio.TaskGroup() as tg:
+        for worker in workers:
+            tg.create_task(worker.stop())
+
+
+@pytest.fixture(scope="module")
+def patched_run_tasks():
+    """Patch task execution once per module instead of once per test.
+
+    unittest.mock.patch setup/teardown (stack walks, attribute lookups)
+    was repeated identically in every worker/integration/hardening test;
+    module scope pays that cost once.
+    """
+    with patch.object(
+        ExecutionWorker, '_run_tasks_in_worktree', side_effect=mock_run_tasks
+    ) as mock_run:
+        yield mock_run
+
+
 class TestTestQueue:
     """Test suite for TestQueue class."""
 
@@ -66,6 +184,74 @@ class TestTestQueue:
         status = queue.get_status()
         assert status["pending_count"] == 5
 
+    @pytest.mark.asyncio
+    async def test_enqueue_batch_nowait_fast_path(self, queue):
+        """Test batch enqueue never suspends while the queue has room."""
+        requests = [
+            TestRequest(id=f"test-{i}", plan_file=f"test-{i}.md")
+            for i in range(5)
+        ]
+
+        # The fast path uses put_nowait; the blocking put is only for a
+        # full queue, so with room available it must never be awaited.
+        async def _blocking_put(item):
+            raise AssertionError("blocking put used despite queue having room")
+
+        queue.pending.put = _blocking_put
+
+        await queue.enqueue_batch(requests)
+
+        assert queue.pending.qsize() == 5
+
+    @pytest.mark.asyncio
+    async def test_get_status_cached(self, queue, sample_request):
+        """Test get_status reuses its dict until the queue mutates."""
+        # No mutation between polls: same instance, no rebuild
+        assert queue.get_status() is queue.get_status()
+
+        # Any mutation invalidates the cache
+        cached = queue.get_status()
+        await queue.enqueue(sample_request)
+        assert queue.get_status() is not cached
+        assert queue.get_status()["pending_count"] == 1
+
+    def test_unbounded_queue_uses_fast_deque(self):
+        """Test max_size=0 selects the deque-backed pending queue."""
+        assert isinstance(TestQueue(max_size=0).pending, FastAsyncDeque)
+        assert isinstance(TestQueue(max_size=10).pending, asyncio.Queue)
+
+    def test_request_has_slots(self, sample_request):
+        """Test TestRequest is slotted (no per-instance __dict__)."""
+        assert not hasattr(sample_request, "__dict__")
+
+    def test_request_identity_is_id(self, sample_request):
+        """Test TestRequest equality and hashing go by id alone."""
+        twin = TestRequest(id=sample_request.id, plan_file="other.md")
+        assert sample_request == twin
+        assert hash(sample_request) == hash(twin)
+        assert len({sample_request, twin}) == 1
+        assert sample_request != TestRequest(
+            id="test-002", plan_file=sample_request.plan_file
+        )
+
+    @pytest.mark.asyncio
+    async def test_dequeue_batch(self, queue):
+        """Test batch dequeue operation."""
+        requests = [
+            TestRequest(id=f"test-{i}", plan_file=f"test-{i}.md")
+            for i in range(5)
+        ]
+        await queue.enqueue_batch(requests)
+
+        # First batch: capped at max_n, in queue order
+        batch = await queue.dequeue_batch(3)
+        assert [r.id for r in batch] == ["test-0", "test-1", "test-2"]
+
+        # Second batch: returns what's left without blocking
+        batch = await queue.dequeue_batch(10)
+        assert [r.id for r in batch] == ["test-3", "test-4"]
+        assert queue.pending.empty()
+
     @pytest.mark.asyncio
     async def test_mark_running(self, queue, sample_request):
         """Test marking a test as running."""
@@ -85,13 +271,7 @@ class TestTestQueue:
         test = await queue.dequeue()
         await queue.mark_running(test)
 
-        result = TestResult(
-            test_request_id=test.id,
-            worktree_id="wt-1",
-            status="COMPLETE",
-            tasks_passed=5,
-            tasks_failed=0,
-        )
+        result = TestResult.make_complete(test.id, "wt-1", tasks_passed=5)
 
         await queue.mark_complete(test.id, result)
 
@@ -107,12 +287,7 @@ class TestTestQueue:
         test = await queue.dequeue()
         await queue.mark_running(test)
 
-        result = TestResult(
-            test_request_id=test.id,
-            worktree_id="wt-1",
-            status="FAILED",
-            error="Test execution failed",
-        )
+        result = TestResult.make_failed(test.id, "wt-1", error="Test execution failed")
 
         await queue.mark_failed(test.id, result)
 
@@ -163,13 +338,7 @@ class TestTestQueue:
             test = await queue.dequeue()
             await queue.mark_running(test)
 
-            result = TestResult(
-                test_request_id=test.id,
-                worktree_id="wt-1",
-                status="COMPLETE",
-                tasks_passed=5,
-                tasks_failed=0,
-            )
+            result = TestResult.make_complete(test.id, "wt-1", tasks_passed=5)
             await queue.mark_complete(test.id, result)
 
         # Create and fail one test
@@ -178,12 +347,7 @@ class TestTestQueue:
         test = await queue.dequeue()
         await queue.mark_running(test)
 
-        result = TestResult(
-            test_request_id=test.id,
-            worktree_id="wt-1",
-            status="FAILED",
-            error="Test failed",
-        )
+        result = TestResult.make_failed(test.id, "wt-1", error="Test failed")
         await queue.mark_failed(test.id, result)
 
         # Get summary
@@ -206,13 +370,13 @@ class TestTestQueue:
             while not queue.pending.empty():
                 test = await queue.dequeue()
                 await queue.mark_running(test)
-                await asyncio.sleep(0.1)
-                result = TestResult(
-                    test_request_id=test.id,
-                    worktree_id="wt-1",
-                    status="COMPLETE",
-                )
-                await queue.mark_complete(test.id, result)
+                # A bare yield stands in for work: the ordering under
+                # test (running -> complete -> empty) doesn't need real
+                # wall-clock sleeps, which made this a 300ms test
+                await asyncio.sleep(0)
+                result = TestResult.make_complete(test.id, "wt-1")
+                # Single locked transition, same as the production worker
+                await queue.transition(test, TestStatus.COMPLETE, result)
 
         # Start processing
         processor_task = asyncio.create_task(process_queue())
@@ -227,6 +391,32 @@ class TestTestQueue:
         # Clean up
         await processor_task
 
+    @pytest.mark.asyncio
+    async def test_wait_until_empty_sees_inflight_batch(self, queue):
+        """Test wait_until_empty blocks while a dequeued batch is unmarked.
+
+        dequeue_batch empties pending before any request is
+        mark_running'd; the queue must not look drained in that window.
+        """
+        await queue.enqueue_batch([
+            TestRequest(id=f"test-{i}", plan_file=f"test-{i}.md")
+            for i in range(3)
+        ])
+        batch = await queue.dequeue_batch(3)
+        assert queue.pending.empty() and not queue.running
+
+        with pytest.raises(TimeoutError):
+            async with asyncio.timeout(0.1):
+                await queue.wait_until_empty()
+
+        for test in batch:
+            await queue.mark_running(test)
+            result = TestResult.make_complete(test.id, "wt-1")
+            await queue.transition(test, TestStatus.COMPLETE, result)
+
+        async with asyncio.timeout(1.0):
+            await queue.wait_until_empty()
+
     @pytest.mark.asyncio
     async def test_clear(self, queue):
         """Test clearing the queue."""
@@ -254,33 +444,21 @@ class TestExecutionWorker:
 
     @pytest.fixture
     def queue(self):
-        """Create a test queue."""
-        return TestQueue()
+        """Create an unbounded test queue (FastAsyncDeque-backed)."""
+        return TestQueue(max_size=0)
 
     @pytest.fixture
-    async def pool(self, tmp_path):
+    async def pool(self, mock_worktree_dirs):
         """Create a mock worktree pool (not real worktrees)."""
-        # Create a simple mock pool that doesn't actually create worktrees
-        pool = WorktreePool(pool_size=1)
-        pool._initialized = True
-
-        # Create a temporary directory for the mock worktree
-        wt_path = tmp_path / "wt-test"
-        wt_path.mkdir(parents=True, exist_ok=True)
-
-        # Create a mock worktree with real path
-        worktree = WorktreeInfo(
-            id="wt-test",
-            path=wt_path,
-            branch="test-branch",
-            status=WorktreeStatus.FREE,
-        )
-        pool.worktrees["wt-test"] = worktree
+        return make_mock_pool(mock_worktree_dirs, 1)
 
-        yield pool
+    @pytest.mark.asyncio
+    async def test_worker_id_accepts_int(self, queue, pool):
+        """Test workers take plain int IDs and format lazily in repr."""
+        worker = ExecutionWorker(worker_id=7, queue=queue, pool=pool)
 
-        # Cleanup: mark as free
-        worktree.status = WorktreeStatus.FREE
+        assert worker.worker_id == 7
+        assert "worker_id=7" in repr(worker)
 
     @pytest.mark.asyncio
     async def test_worker_lifecycle(self, queue, pool):
@@ -301,380 +479,194 @@ class TestExecutionWorker:
         assert worker.running is False
 
     @pytest.mark.asyncio
-    async def test_worker_processes_test(self, queue, pool):
+    async def test_stop_reaps_dequeue_task(self, queue, pool, patched_run_tasks):
+        """Test stop() cancels the worker's blocked dequeue task too.
+
+        stop() cancels the worker while it waits on dequeue-or-stop;
+        asyncio.wait does not cancel its children, so without explicit
+        cleanup the dequeue task outlives the worker, steals the next
+        enqueued request into the in-flight set, and wait_until_empty
+        hangs forever on the restart path.
+        """
+        worker = ExecutionWorker(
+            worker_id="worker-test",
+            queue=queue,
+            pool=pool,
+        )
+
+        # Stop the worker while it is blocked waiting for a batch
+        await worker.start()
+        await asyncio.sleep(0)
+        await worker.stop()
+
+        lingering = [
+            task for task in asyncio.all_tasks()
+            if "dequeue_batch" in getattr(task.get_coro(), "__qualname__", "")
+        ]
+        assert not lingering, "dequeue task survived worker stop"
+
+        # A restarted worker must process new work; an orphaned dequeue
+        # would strand the request in flight and hang the wait
+        await worker.start()
+        await queue.enqueue(
+            TestRequest(id="after-restart", plan_file="after-restart.md")
+        )
+        try:
+            async with asyncio.timeout(2.0):
+                await queue.wait_until_empty()
+        except TimeoutError:
+            pytest.fail("request enqueued after stop/start was never processed")
+        await worker.stop()
+
+        assert "after-restart" in queue.completed
+        assert not queue._inflight
+
+    @pytest.mark.asyncio
+    async def test_worker_processes_test(self, queue, pool, patched_run_tasks):
         """Test worker processes a test from queue."""
-        # Mock the database session and task execution
-        with patch('backend.app.database.sync_session') as mock_session, \
-             patch.object(ExecutionWorker, '_run_tasks_in_worktree') as mock_run:
-            mock_db = Mock()
-            mock_session.return_value = mock_db
-            mock_db.close = Mock()
-
-            # Mock successful task execution
-            mock_run.return_value = TestResult(
-                test_request_id="test-001",
-                worktree_id="wt-test",
-                status="COMPLETE",
-                tasks_passed=1,
-                tasks_failed=0,
-            )
-
-            worker = ExecutionWorker(
-                worker_id="worker-test",
-                queue=queue,
-                pool=pool,
-            )
-
-            # Add a test to the queue
-            request = TestRequest(
-                id="test-001",
-                plan_file="test-01.md",
-            )
-            await queue.enqueue(request)
+        worker = ExecutionWorker(
+            worker_id="worker-test",
+            queue=queue,
+            pool=pool,
+        )
 
-            # Start worker
-            await worker.start()
+        # Add a test to the queue
+        request = TestRequest(
+            id="test-001",
+            plan_file="test-01.md",
+        )
+        await queue.enqueue(request)
+
+        # Start worker
+        await worker.start()
 
-            # Wait for test to be processed (with timeout)
-            try:
-                await asyncio.wait_for(
-                    queue.wait_until_empty(),
-                    timeout=5.0
-                )
-            except asyncio.TimeoutError:
-                pytest.fail("Worker did not process test in time")
+        # Wait for test to be processed (with timeout); the timeout
+        # context manager skips the extra Task that wait_for spawns
+        try:
+            async with asyncio.timeout(5.0):
+                await queue.wait_until_empty()
+        except TimeoutError:
+            pytest.fail("Worker did not process test in time")
 
-            # Stop worker
-            await worker.stop()
+        # Stop worker
+        await worker.stop()
 
-            # Verify test was processed
-            status = queue.get_status()
-            assert status["pending_count"] == 0
-            assert status["running_count"] == 0
-            assert status["completed_count"] == 1
+        # Verify test was processed
+        status = queue.get_status()
+        assert status["pending_count"] == 0
+        assert status["running_count"] == 0
+        assert status["completed_count"] == 1
 
     @pytest.mark.asyncio
-    async def test_worker_handles_multiple_tests(self, queue, pool):
+    async def test_worker_handles_multiple_tests(self, queue, pool, patched_run_tasks):
         """Test worker handles multiple tests sequentially."""
-        # Mock the database session and task execution
-        with patch('backend.app.database.sync_session') as mock_session, \
-             patch.object(ExecutionWorker, '_run_tasks_in_worktree') as mock_run:
-            mock_db = Mock()
-            mock_session.return_value = mock_db
-            mock_db.close = Mock()
-
-            # Mock successful task execution (return different result for each test)
-            def mock_run_tasks(test_request, worktree, started_at):
-                return TestResult(
-                    test_request_id=test_request.id,
-                    worktree_id=worktree.id,
-                    status="COMPLETE",
-                    tasks_passed=1,
-                    tasks_failed=0,
-                )
-            mock_run.side_effect = mock_run_tasks
-
-            worker = ExecutionWorker(
-                worker_id="worker-test",
-                queue=queue,
-                pool=pool,
-            )
-
-            # Add multiple tests
-            for i in range(3):
-                request = TestRequest(
-                    id=f"test-{i}",
-                    plan_file=f"test-{i}.md",
-                )
-                await queue.enqueue(request)
-
-            # Start worker
-            await worker.start()
-
-            # Wait for all tests to be processed
-            try:
-                await asyncio.wait_for(
-                    queue.wait_until_empty(),
-                    timeout=10.0
-                )
-            except asyncio.TimeoutError:
-                pytest.fail("Worker did not process all tests in time")
-
-            # Stop worker
-            await worker.stop()
-
-            # Verify all tests were processed
-            status = queue.get_status()
-            assert status["completed_count"] == 3
+        worker = ExecutionWorker(
+            worker_id="worker-test",
+            queue=queue,
+            pool=pool,
+        )
+
+        # Add multiple tests in one batch submit
+        await queue.enqueue_batch([
+            TestRequest(id=f"test-{i}", plan_file=f"test-{i}.md")
+            for i in range(3)
+        ])
+
+        # Start worker
+        await worker.start()
+
+        # Wait for all tests to be processed
+        try:
+            async with asyncio.timeout(10.0):
+                await queue.wait_until_empty()
+        except TimeoutError:
+            pytest.fail("Worker did not process all tests in time")
+
+        # Stop worker
+        await worker.stop()
+
+        # Verify all tests were processed
+        status = queue.get_status()
+        assert status["completed_count"] == 3
 
 
 class TestIntegration:
     """Integration tests for the full parallel execution system."""
 
     @pytest.mark.asyncio
-    async def test_multiple_workers_process_queue(self, tmp_path):
+    async def test_multiple_workers_process_queue(self, mock_worktree_dirs, patched_run_tasks):
         """Test multiple workers processing tests in parallel."""
-        # Mock the database session and task execution
-        with patch('backend.app.database.sync_session') as mock_session, \
-             patch.object(ExecutionWorker, '_run_tasks_in_worktree') as mock_run:
-            mock_db = Mock()
-            mock_session.return_value = mock_db
-            mock_db.close = Mock()
-
-            # Mock successful task execution
-            def mock_run_tasks(test_request, worktree, started_at):
-                return TestResult(
-                    test_request_id=test_request.id,
-                    worktree_id=worktree.id,
-                    status="COMPLETE",
-                    tasks_passed=1,
-                    tasks_failed=0,
-                )
-            mock_run.side_effect = mock_run_tasks
-
-            queue = TestQueue()
-
-            # Create mock pool with 2 worktrees with real temp paths
-            pool = WorktreePool(pool_size=2)
-            pool._initialized = True
-
-            for i in range(1, 3):
-                wt_path = tmp_path / f"wt-{i}"
-                wt_path.mkdir(parents=True, exist_ok=True)
-
-                worktree = WorktreeInfo(
-                    id=f"wt-{i}",
-                    path=wt_path,
-                    branch=f"branch-{i}",
-                    status=WorktreeStatus.FREE,
-                )
-                pool.worktrees[f"wt-{i}"] = worktree
-
-            # Create 2 workers
-            workers = [
-                ExecutionWorker(f"worker-{i}", queue, pool)
-                for i in range(1, 3)
-            ]
-
-            # Add 6 tests to the queue
-            for i in range(6):
-                request = TestRequest(
-                    id=f"test-{i}",
-                    plan_file=f"test-{i}.md",
-                )
-                await queue.enqueue(request)
-
-            # Start workers
-            for worker in workers:
-                await worker.start()
-
-            # Wait for all tests to complete
-            try:
-                await asyncio.wait_for(
-                    queue.wait_until_empty(),
-                    timeout=15.0
-                )
-            except asyncio.TimeoutError:
-                pytest.fail("Workers did not process all tests in time")
-
-            # Stop workers
-            for worker in workers:
-                await worker.stop()
-
-            # Verify all tests completed
-            status = queue.get_status()
-            assert status["completed_count"] == 6
-            assert status["failed_count"] == 0
-
-            # Cleanup
-            for worktree in pool.worktrees.values():
-                worktree.status = WorktreeStatus.FREE
+        queue, pool, workers = await build_exec_stack(mock_worktree_dirs, 2, 6)
+
+        await run_workers_until_empty(
+            queue, workers, timeout=10.0,
+            fail_msg="Workers did not process all tests in time",
+        )
+
+        # Verify all tests completed
+        status = queue.get_status()
+        assert status["completed_count"] == 6
+        assert status["failed_count"] == 0
 
 
 class TestHardening:
     """Hardening tests for robustness and edge cases."""
 
+    def test_worktree_info_slots(self, mock_worktree_dirs):
+        """Test WorktreeInfo is slotted (no per-instance __dict__)."""
+        info = WorktreeInfo(
+            id="wt-1",
+            path=mock_worktree_dirs[0],
+            branch="branch-1",
+            status=WorktreeStatus.FREE,
+        )
+        assert not hasattr(info, "__dict__")
+
     @pytest.mark.asyncio
-    async def test_pool_exhaustion_queueing(self, tmp_path):
+    async def test_pool_exhaustion_queueing(self, mock_worktree_dirs, patched_run_tasks):
         """Test that 6 tasks with 2 workers queues properly without deadlock."""
-        # Mock the database session and task execution
-        with patch('backend.app.database.sync_session') as mock_session, \
-             patch.object(ExecutionWorker, '_run_tasks_in_worktree') as mock_run:
-            mock_db = Mock()
-            mock_session.return_value = mock_db
-            mock_db.close = Mock()
-
-            # Mock successful task execution
-            def mock_run_tasks(test_request, worktree, started_at):
-                return TestResult(
-                    test_request_id=test_request.id,
-                    worktree_id=worktree.id,
-                    status="COMPLETE",
-                    tasks_passed=1,
-                    tasks_failed=0,
-                )
-            mock_run.side_effect = mock_run_tasks
-
-            queue = TestQueue()
-
-            # Create pool with only 2 worktrees
-            pool = WorktreePool(pool_size=2)
-            pool._initialized = True
-
-            for i in range(1, 3):
-                wt_path = tmp_path / f"wt-{i}"
-                wt_path.mkdir(parents=True, exist_ok=True)
-
-                worktree = WorktreeInfo(
-                    id=f"wt-{i}",
-                    path=wt_path,
-                    branch=f"branch-{i}",
-                    status=WorktreeStatus.FREE,
-                )
-                pool.worktrees[f"wt-{i}"] = worktree
-
-            # Create 2 workers for 2 worktrees
-            workers = [
-                ExecutionWorker(f"worker-{i}", queue, pool)
-                for i in range(1, 3)
-            ]
-
-            # Submit 6 tasks (3x more than workers)
-            for i in range(6):
-                request = TestRequest(
-                    id=f"test-{i}",
-                    plan_file=f"test-{i}.md",
-                )
-                await queue.enqueue(request)
-
-            # Verify 6 tasks pending
-            status = queue.get_status()
-            assert status["pending_count"] == 6
-
-            # Start workers
-            for worker in workers:
-                await worker.start()
-
-            # Wait for all tests to complete (with reasonable timeout)
-            try:
-                await asyncio.wait_for(
-                    queue.wait_until_empty(),
-                    timeout=30.0  # Should complete in ~3 batches
-                )
-            except asyncio.TimeoutError:
-                pytest.fail("Pool exhaustion test timed out - possible deadlock")
-
-            # Stop workers
-            for worker in workers:
-                await worker.stop()
-
-            # Verify all 6 tests completed
-            status = queue.get_status()
-            assert status["completed_count"] == 6
-            assert status["failed_count"] == 0
-
-            # Cleanup
-            for worktree in pool.worktrees.values():
-                worktree.status = WorktreeStatus.FREE
+        # 3x more tasks than workers
+        queue, pool, workers = await build_exec_stack(mock_worktree_dirs, 2, 6)
+
+        # Verify 6 tasks pending
+        assert queue.get_status()["pending_count"] == 6
+
+        await run_workers_until_empty(
+            queue, workers, timeout=15.0,  # ~3 batches
+            fail_msg="Pool exhaustion test timed out - possible deadlock",
+        )
+
+        # Verify all 6 tests completed
+        status = queue.get_status()
+        assert status["completed_count"] == 6
+        assert status["failed_count"] == 0
 
     @pytest.mark.asyncio
-    async def test_stress_10_tasks(self, tmp_path):
+    async def test_stress_10_tasks(self, mock_worktree_dirs, patched_run_tasks):
         """Stress test with 10+ tasks to validate scalability."""
-        # Mock the database session and task execution
-        with patch('backend.app.database.sync_session') as mock_session, \
-             patch.object(ExecutionWorker, '_run_tasks_in_worktree') as mock_run:
-            mock_db = Mock()
-            mock_session.return_value = mock_db
-            mock_db.close = Mock()
-
-            # Mock successful task execution
-            def mock_run_tasks(test_request, worktree, started_at):
-                return TestResult(
-                    test_request_id=test_request.id,
-                    worktree_id=worktree.id,
-                    status="COMPLETE",
-                    tasks_passed=1,
-                    tasks_failed=0,
-                )
-            mock_run.side_effect = mock_run_tasks
-
-            queue = TestQueue()
-
-            # Create pool with 3 worktrees
-            pool = WorktreePool(pool_size=3)
-            pool._initialized = True
-
-            for i in range(1, 4):
-                wt_path = tmp_path / f"wt-{i}"
-                wt_path.mkdir(parents=True, exist_ok=True)
-
-                worktree = WorktreeInfo(
-                    id=f"wt-{i}",
-                    path=wt_path,
-                    branch=f"branch-{i}",
-                    status=WorktreeStatus.FREE,
-                )
-                pool.worktrees[f"wt-{i}"] = worktree
-
-            # Create 3 workers
-            workers = [
-                ExecutionWorker(f"worker-{i}", queue, pool)
-                for i in range(1, 4)
-            ]
-
-            # Submit 12 tasks (4x workers)
-            num_tasks = 12
-            for i in range(num_tasks):
-                request = TestRequest(
-                    id=f"stress-test-{i}",
-                    plan_file=f"stress-test-{i}.md",
-                )
-                await queue.enqueue(request)
-
-            # Start workers
-            for worker in workers:
-                await worker.start()
-
-            # Wait for completion
-            try:
-                await asyncio.wait_for(
-                    queue.wait_until_empty(),
-                    timeout=60.0  # ~4 batches
-                )
-            except asyncio.TimeoutError:
-                pytest.fail("Stress test timed out")
-
-            # Stop workers
-            for worker in workers:
-                await worker.stop()
-
-            # Verify all tasks completed
-            status = queue.get_status()
-            assert status["completed_count"] == num_tasks
-            assert status["failed_count"] == 0
-
-            # Cleanup
-            for worktree in pool.worktrees.values():
-                worktree.status = WorktreeStatus.FREE
+        # 12 tasks in one batch (4x workers)
+        num_tasks = 12
+        queue, pool, workers = await build_exec_stack(
+            mock_worktree_dirs, 3, num_tasks, id_prefix="stress-test"
+        )
+
+        await run_workers_until_empty(
+            queue, workers, timeout=20.0,  # ~4 batches
+            fail_msg="Stress test timed out",
+        )
+
+        # Verify all tasks completed
+        status = queue.get_status()
+        assert status["completed_count"] == num_tasks
+        assert status["failed_count"] == 0
 
     @pytest.mark.asyncio
-    async def test_acquire_timeout(self, tmp_path):
+    async def test_acquire_timeout(self, mock_worktree_dirs):
         """Test that worktree acquisition properly times out."""
-        pool = WorktreePool(pool_size=1)
-        pool._initialized = True
-
-        # Create one worktree but mark it BUSY
-        wt_path = tmp_path / "wt-1"
-        wt_path.mkdir(parents=True, exist_ok=True)
+        pool = make_mock_pool(mock_worktree_dirs, 1)
 
-        worktree = WorktreeInfo(
-            id="wt-1",
-            path=wt_path,
-            branch="branch-1",
-            status=WorktreeStatus.BUSY,  # Already busy
-            current_test="blocking-test",
-        )
-        pool.worktrees["wt-1"] = worktree
+        # Hold the only worktree so the next acquisition must wait
+        await pool.acquire(test_name="blocking-test", timeout=2.0)
 
         # Import the exception class
         from backend.app.services.worktree_pool import WorktreeAcquisitionTimeout
@@ -687,17 +679,16 @@ class TestHardening:
         assert "blocking-test" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_error_worktree_recovery(self, tmp_path):
+    async def test_error_worktree_recovery(self, tmp_path, wt_skeleton):
         """Test that ERROR worktrees are identified by health check."""
         pool = WorktreePool(pool_size=1)
         pool._initialized = True
         pool.main_repo_path = tmp_path  # Use tmp_path as fake repo
         pool.base_dir = tmp_path / "worktrees"
 
-        # Create a worktree directory with .git as directory (more realistic)
+        # Alias the shared git-shaped skeleton instead of two mkdirs
         wt_path = tmp_path / "wt-1"
-        wt_path.mkdir(parents=True, exist_ok=True)
-        (wt_path / ".git").mkdir()  # Fake git dir
+        os.symlink(wt_skeleton, wt_path, target_is_directory=True)
 
         worktree = WorktreeInfo(
             id="wt-1",
@@ -723,23 +714,10 @@ class TestHardening:
             # (though recovery was mocked to succeed)
 
     @pytest.mark.asyncio
-    async def test_worker_status_tracking(self, tmp_path):
+    async def test_worker_status_tracking(self, mock_worktree_dirs):
         """Test that worker status properly tracks current test."""
         queue = TestQueue()
-
-        pool = WorktreePool(pool_size=1)
-        pool._initialized = True
-
-        wt_path = tmp_path / "wt-1"
-        wt_path.mkdir(parents=True, exist_ok=True)
-
-        worktree = WorktreeInfo(
-            id="wt-1",
-            path=wt_path,
-            branch="branch-1",
-            status=WorktreeStatus.FREE,
-        )
-        pool.worktrees["wt-1"] = worktree
+        pool = make_mock_pool(mock_worktree_dirs, 1)
 
         worker = ExecutionWorker(
             "worker-test",
@@ -757,22 +735,9 @@ class TestHardening:
         assert status["task_timeout_seconds"] == 60.0
 
     @pytest.mark.asyncio
-    async def test_concurrent_acquire_release(self, tmp_path):
+    async def test_concurrent_acquire_release(self, mock_worktree_dirs):
         """Test that concurrent acquire/release doesn't deadlock."""
-        pool = WorktreePool(pool_size=2)
-        pool._initialized = True
-
-        for i in range(1, 3):
-            wt_path = tmp_path / f"wt-{i}"
-            wt_path.mkdir(parents=True, exist_ok=True)
-
-            worktree = WorktreeInfo(
-                id=f"wt-{i}",
-                path=wt_path,
-                branch=f"branch-{i}",
-                status=WorktreeStatus.FREE,
-            )
-            pool.worktrees[f"wt-{i}"] = worktree
+        pool = make_mock_pool(mock_worktree_dirs, 2)
 
         # Acquire both worktrees
         wt1 = await pool.acquire(test_name="test-1", timeout=5.0)
@@ -781,17 +746,23 @@ class TestHardening:
         assert wt1.status == WorktreeStatus.BUSY
         assert wt2.status == WorktreeStatus.BUSY
 
-        # Start a task that will try to acquire (should wait)
+        # Start a task that will try to acquire (should wait). It
+        # signals before acquiring so we wait exactly as long as the
+        # scheduler needs, not a fixed 0.5s.
+        acquire_started = asyncio.Event()
+
         async def try_acquire():
+            acquire_started.set()
             return await pool.acquire(test_name="test-3", timeout=10.0)
 
         acquire_task = asyncio.create_task(try_acquire())
+        await acquire_started.wait()
 
-        # Give it a moment to start waiting
-        await asyncio.sleep(0.5)
-
-        # Release one worktree - this should NOT deadlock
-        wt1.status = WorktreeStatus.FREE  # Simulate release
+        # Release one worktree through the real path - this should wake
+        # the waiter without deadlock. Read-only so the next acquire
+        # skips the git cleanup this mock pool can't run.
+        wt1.mutating = False
+        await pool.release(wt1)
 
         # The waiting acquire should now succeed
         try:
@@ -799,7 +770,3 @@ class TestHardening:
             assert wt3.status == WorktreeStatus.BUSY
         except asyncio.TimeoutError:
             pytest.fail("Concurrent acquire/release caused deadlock")
-
-        # Cleanup
-        for wt in pool.worktrees.values():
-            wt.status = WorktreeStatus.FREE